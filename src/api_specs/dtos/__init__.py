@@ -4,63 +4,114 @@ This package organizes DTOs by resource type:
 - base: Common base types (BaseApiResponse)
 - memory: Memory resource DTOs (memorize, fetch, search, delete)
 - conversation_meta: Conversation metadata resource DTOs
+
+Exports are resolved lazily (PEP 562): a submodule is only imported the first
+time one of its names is accessed, so importing this package does not build
+every Pydantic model up front.
 """
 
-# Base types
-from api_specs.dtos.base import BaseApiResponse, T
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Base types
+    from api_specs.dtos.base import BaseApiResponse, T
+
+    # Memory resource DTOs
+    from api_specs.dtos.memory import (
+        # Raw data
+        RawData,
+        # Memorize
+        MemorizeRequest,
+        MemorizeMessageRequest,
+        MemorizeResult,
+        MemorizeResponse,
+        # Fetch
+        FetchMemRequest,
+        FetchMemResponse,
+        FetchMemoriesResponse,
+        # Search/Retrieve
+        RetrieveMemRequest,
+        PendingMessage,
+        RetrieveMemResponse,
+        SearchMemoriesResponse,
+        # === BEGIN: 非官方扩展 ===
+        # 添加时间：2026-02-16
+        # 开发者：HPC2H2
+        # 用途：处理待清理的 pending 消息
+        # 状态：实验性功能，可能在未来版本移除
+        # Clear pending
+        ClearPendingRequest,
+        ClearPendingResult,
+        ClearPendingResponse,
+        # === END: 非官方扩展 ===
+        # Delete
+        DeleteMemoriesRequest,
+        DeleteMemoriesResult,
+        DeleteMemoriesResponse,
+    )
+
+    # Conversation metadata resource DTOs
+    from api_specs.dtos.conversation_meta import (
+        # Common types
+        UserDetail,
+        # Internal request
+        ConversationMetaRequest,
+        # Create
+        ConversationMetaCreateRequest,
+        # Get
+        ConversationMetaGetRequest,
+        ConversationMetaResponse,
+        GetConversationMetaResponse,
+        SaveConversationMetaResponse,
+        # Patch
+        ConversationMetaPatchRequest,
+        PatchConversationMetaResult,
+        PatchConversationMetaResponse,
+    )
 
-# Memory resource DTOs
-from api_specs.dtos.memory import (
-    # Raw data
-    RawData,
-    # Memorize
-    MemorizeRequest,
-    MemorizeMessageRequest,
-    MemorizeResult,
-    MemorizeResponse,
-    # Fetch
-    FetchMemRequest,
-    FetchMemResponse,
-    FetchMemoriesResponse,
-    # Search/Retrieve
-    RetrieveMemRequest,
-    PendingMessage,
-    RetrieveMemResponse,
-    SearchMemoriesResponse,
-    # === BEGIN: 非官方扩展 ===
-    # 添加时间：2026-02-16
-    # 开发者：HPC2H2
-    # 用途：处理待清理的 pending 消息
-    # 状态：实验性功能，可能在未来版本移除
-    # Clear pending
-    ClearPendingRequest,
-    ClearPendingResult,
-    ClearPendingResponse,
-    # === END: 非官方扩展 ===
-    # Delete
-    DeleteMemoriesRequest,
-    DeleteMemoriesResult,
-    DeleteMemoriesResponse,
-)
+# Submodule -> names it exports
+_SUBMODULE_EXPORTS = {
+    "api_specs.dtos.base": ("BaseApiResponse", "T"),
+    "api_specs.dtos.memory": (
+        "RawData",
+        "MemorizeRequest",
+        "MemorizeMessageRequest",
+        "MemorizeResult",
+        "MemorizeResponse",
+        "FetchMemRequest",
+        "FetchMemResponse",
+        "FetchMemoriesResponse",
+        "RetrieveMemRequest",
+        "PendingMessage",
+        "RetrieveMemResponse",
+        "SearchMemoriesResponse",
+        "ClearPendingRequest",
+        "ClearPendingResult",
+        "ClearPendingResponse",
+        "DeleteMemoriesRequest",
+        "DeleteMemoriesResult",
+        "DeleteMemoriesResponse",
+    ),
+    "api_specs.dtos.conversation_meta": (
+        "UserDetail",
+        "ConversationMetaRequest",
+        "ConversationMetaCreateRequest",
+        "ConversationMetaGetRequest",
+        "ConversationMetaResponse",
+        "GetConversationMetaResponse",
+        "SaveConversationMetaResponse",
+        "ConversationMetaPatchRequest",
+        "PatchConversationMetaResult",
+        "PatchConversationMetaResponse",
+    ),
+}
 
-# Conversation metadata resource DTOs
-from api_specs.dtos.conversation_meta import (
-    # Common types
-    UserDetail,
-    # Internal request
-    ConversationMetaRequest,
-    # Create
-    ConversationMetaCreateRequest,
-    # Get
-    ConversationMetaGetRequest,
-    ConversationMetaResponse,
-    GetConversationMetaResponse,
-    SaveConversationMetaResponse,
-    # Patch
-    ConversationMetaPatchRequest,
-    PatchConversationMetaResult,
-    PatchConversationMetaResponse,
-)
+# Exported name -> submodule defining it, built once at import
+_name_to_submodule = {
+    name: submodule for submodule, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     # Base
@@ -102,3 +153,20 @@ __all__ = [
     "PatchConversationMetaResult",
     "PatchConversationMetaResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining `name` on first access and cache the result."""
+    submodule = _name_to_submodule.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Peek at sys.modules first to skip the import machinery for loaded submodules
+    module = sys.modules.get(submodule) or importlib.import_module(submodule)
+    value = getattr(module, name)
+    # Later lookups hit the module dict and never reach __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
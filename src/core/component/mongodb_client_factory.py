@@ -20,6 +20,7 @@ from core.di.decorators import component
 from core.observation.logger import get_logger
 from common_utils.datetime_utils import timezone
 from core.oxm.mongo.document_base import DEFAULT_DATABASE
+from core.oxm.mongo.document_base_with_soft_delete import DocumentBaseWithSoftDelete
 
 logger = get_logger(__name__)
 
@@ -176,6 +177,11 @@ class MongoDBClientWrapper:
                         skip_indexes=True,
                     )
 
+                # Collections are rebound by init_beanie, drop memoized handles
+                for model in document_models:
+                    if issubclass(model, DocumentBaseWithSoftDelete):
+                        model.reset_collection_cache()
+
                 self._document_models = document_models
                 self._initialized = True
                 logger.info(
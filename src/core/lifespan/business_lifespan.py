@@ -32,6 +32,13 @@ def get_rerank_service():
     return _get_rerank_service()
 
 
+def get_memcell_delete_service():
+    """Lazy import wrapper for the MemCell delete service bean."""
+    from service.memcell_delete_service import MemCellDeleteService
+
+    return get_bean_by_type(MemCellDeleteService)
+
+
 @component(name="business_lifespan_provider")
 class BusinessLifespanProvider(LifespanProvider):
     """Business lifecycle provider"""
@@ -97,10 +104,11 @@ class BusinessLifespanProvider(LifespanProvider):
         logger.info("Business application shutdown completed")
 
     async def _close_agentic_services(self) -> None:
-        """Close shared agentic services to release external client sessions."""
+        """Close shared services to release client sessions and background workers."""
         service_getters = (
             ("vectorize", get_vectorize_service),
             ("rerank", get_rerank_service),
+            ("memcell_delete", get_memcell_delete_service),
         )
         for service_name, service_getter in service_getters:
             try:
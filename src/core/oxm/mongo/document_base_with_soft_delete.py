@@ -4,19 +4,83 @@ MongoDB Document Base With Soft Delete
 Base document class with soft delete functionality, providing complete soft delete support.
 """
 
+import asyncio
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
 from beanie.odm.enums import SortDirection
 from beanie.odm.bulk import BulkWriter
 from beanie.odm.actions import ActionDirections
-from beanie import DeleteRules
-from pydantic import Field, BaseModel
-from typing import List, Optional, Any, Mapping, Union, Tuple, Dict, Type
+from beanie import DeleteRules, PydanticObjectId
+from pydantic import Field, BaseModel, model_validator
+from typing import (
+    List,
+    Optional,
+    Any,
+    Mapping,
+    Union,
+    Tuple,
+    Dict,
+    Type,
+    Iterable,
+    ClassVar,
+    Iterator,
+    AsyncIterator,
+    Set,
+    Callable,
+)
+from pymongo import UpdateOne
 from pymongo.asynchronous.client_session import AsyncClientSession
-from pymongo.results import UpdateResult, DeleteResult
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.results import UpdateResult, DeleteResult, BulkWriteResult
 
 from common_utils.datetime_utils import get_now_with_timezone
 from core.oxm.mongo.document_base import DocumentBase
 
+# Filter matching undeleted documents, shared by every query, read-only
+_SOFT_DELETE_PREDICATE: Mapping[str, Any] = MappingProxyType({"deleted": False})
+# Filter matching all documents, shared like the predicate above
+_NO_SOFT_DELETE_PREDICATE: Mapping[str, Any] = MappingProxyType({})
+
+# Restore payload, constant for every document, shared and must never be mutated
+_RESTORE_FIELDS: Dict[str, Any] = {
+    "deleted": False,
+    "deleted_at": None,
+    "deleted_by": None,
+}
+_RESTORE_UPDATE: Dict[str, Any] = {"$set": _RESTORE_FIELDS}
+
+# Deletion timestamp shared by all soft deletes inside batch_delete_window()
+_current_delete_timestamp: ContextVar[Optional[datetime]] = ContextVar(
+    "current_delete_timestamp", default=None
+)
+
+
+def _get_delete_timestamp() -> datetime:
+    """Get the active batch deletion timestamp, or the current time outside a window"""
+    return _current_delete_timestamp.get() or get_now_with_timezone()
+
+
+def _soft_delete_update(now: datetime, deleted_by: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the soft delete update document, once per operation and shared by its writes
+
+    The driver only encodes it, so one instance can back any number of update calls.
+
+    Args:
+        now: Deletion timestamp
+        deleted_by: Deletion operator identifier
+
+    Returns:
+        Dict[str, Any]: $set update document
+    """
+    return {"$set": {"deleted": True, "deleted_at": now, "deleted_by": deleted_by}}
+
 
 class DocumentBaseWithSoftDelete(DocumentBase):
     """
@@ -27,93 +91,140 @@ class DocumentBaseWithSoftDelete(DocumentBase):
     - Supports timezone-aware datetime handling (from DocumentBase)
     - Supports database binding configuration (from DocumentBase)
     - Supports audit field handling during bulk insert (from DocumentBase)
-    - **Extended deletion audit fields: deleted_by (deleter) and deleted_id (uniqueness trick)**
+    - **Extended deletion audit field: deleted_by (deleter)**
     - **Complete bulk soft delete support**
 
-    Soft delete field descriptions:
+    Soft delete fields:
+        - deleted: boolean deletion flag, the predicate used by all query filters
         - deleted_at: deletion timestamp
         - deleted_by: identifier of the deletion operator
-        - deleted_id: deletion identifier ID, used for unique index trick
-          * When not deleted: deleted_id = 0 (all undeleted documents share this value)
-          * When deleted: deleted_id = hash value of the document's _id
-          * Advantage: can create unique index on (business field + deleted_id), achieving:
-            - Only one record allowed for the same business key when undeleted
-            - Multiple historical records allowed for the same business key after deletion
-            - New records with the same business key can be inserted after soft deletion
-
-    Core methods:
-        Instance methods:
-        - delete(): soft delete current document
-        - restore(): restore a deleted document
-        - hard_delete(): hard delete current document (physical deletion)
-        - is_deleted(): check if document is deleted
-
-        Class methods (queries):
-        - find_one(): find one document (automatically filters out deleted ones)
-        - find_many(): find multiple documents (automatically filters out deleted ones)
-        - hard_find_one(): hard find one document (including deleted ones)
-        - hard_find_many(): hard find multiple documents (including deleted ones)
-
-        Class methods (bulk operations):
-        - delete_many(): bulk soft delete
-        - restore_many(): bulk restore
-        - hard_delete_many(): bulk hard delete
-
-        Utility methods (for native pymongo API):
-        - apply_soft_delete_filter(): apply soft delete filter condition to query
-        - get_soft_delete_filter(): get pure soft delete filter condition
-
-    Important notes:
-        ⚠️ Do not use Model.find().delete_many(), it performs hard deletion!
-        Use Model.delete_many(filter) to perform bulk soft deletion.
-
-    Usage example:
-        from pydantic import Field
-
-        class MyDocument(DocumentBaseWithSoftDelete, AuditBase):
-            email: str
-            name: str
-
-            class Settings:
-                bind_database = "my_database"
-                collection = "my_collection"
-                # Unique index: only one record allowed for the same email when undeleted
-                indexes = [
-                    [("email", 1), ("deleted_id", 1)],  # composite unique index
-                ]
-
-        # Single soft delete
-        doc = await MyDocument.find_one({"email": "test@example.com"})
-        await doc.delete(deleted_by="admin")  # soft delete
-
-        # Bulk soft delete
-        result = await MyDocument.delete_many(
-            {"status": "inactive"},
-            deleted_by="system"
-        )
 
-        # Restore single document
-        doc = await MyDocument.hard_find_one({"email": "test@example.com"})
-        if doc and doc.is_deleted():
-            await doc.restore()
+    ⚠️ Do not use Model.find().delete_many(), it performs hard deletion!
+    Use Model.delete_many(filter) to perform bulk soft deletion.
 
-        # Bulk hard delete (use with caution!)
-        result = await MyDocument.hard_delete_many({"is_test": True})
-
-        # Apply soft delete filter when using native pymongo API
-        filter_dict = MyDocument.apply_soft_delete_filter({"status": "active"})
-        result = await MyDocument.get_pymongo_collection().find(filter_dict).to_list(100)
+    Method overview, index recommendations and usage examples:
+    docs/dev_docs/soft_delete_guide.md
     """
 
     # Soft delete related fields
+    deleted: bool = Field(default=False, description="Soft deletion flag")
     deleted_at: Optional[datetime] = Field(
         default=None, description="Soft deletion timestamp"
     )
     deleted_by: Optional[str] = Field(default=None, description="Deletion operator")
-    deleted_id: int = Field(
-        default=0, description="Deletion identifier ID, used for unique index trick"
+    # Internal: tells a bulk_delete_by_ids() call which documents it deleted
+    delete_marker: Optional[PydanticObjectId] = Field(
+        default=None,
+        exclude=True,
+        description="Marker of the bulk_delete_by_ids() call that deleted the document",
     )
 
+    # Pymongo collection handle memoized per class, see _collection()
+    _cached_collection: ClassVar[Optional[AsyncCollection]] = None
+
+    @classmethod
+    def _collection(cls) -> AsyncCollection:
+        """
+        Get the pymongo collection of this model, memoized on the class
+
+        Looked up in the class's own __dict__ so subclasses never share a parent's handle.
+
+        Returns:
+            AsyncCollection: Collection bound by init_beanie
+        """
+        collection = cls.__dict__.get("_cached_collection")
+        if collection is None:
+            collection = cls.get_pymongo_collection()
+            cls._cached_collection = collection
+        return collection
+
+    @classmethod
+    def reset_collection_cache(cls) -> None:
+        """
+        Drop the memoized collection handle and class id filters
+
+        Must be called after (re)running init_beanie for this model.
+        """
+        cls._cached_collection = None
+        cls._class_id_filters.cache_clear()
+
+    # Callbacks run after each restore, registered per class, see add_restore_listener()
+    _restore_listeners: ClassVar[Optional[List[weakref.WeakMethod]]] = None
+
+    @classmethod
+    def add_restore_listener(cls, callback: Callable[[], None]) -> None:
+        """
+        Call callback after every restore of this model or its subclasses
+
+        restore(), bulk_restore() and restore_many() all notify the listeners, so
+        caches of deletion state can be invalidated whoever restores. Only a weak
+        reference is kept, the listener goes away with the object it is bound to.
+
+        Args:
+            callback: Bound method taking no arguments
+        """
+        listeners = cls.__dict__.get("_restore_listeners")
+        if listeners is None:
+            listeners = []
+            cls._restore_listeners = listeners
+        listeners.append(weakref.WeakMethod(callback))
+
+    @classmethod
+    def _notify_restored(cls) -> None:
+        """Call the restore listeners of this class and its bases, dropping dead ones"""
+        for klass in cls.__mro__:
+            listeners = klass.__dict__.get("_restore_listeners")
+            if not listeners:
+                continue
+            live = []
+            for ref in listeners:
+                callback = ref()
+                if callback is not None:
+                    callback()
+                    live.append(ref)
+            listeners[:] = live
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _class_id_filters(cls, with_children: bool) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get the class id filters beanie adds for this model, memoized per (cls, with_children)
+
+        Empty unless the model uses beanie inheritance or union documents.
+
+        Args:
+            with_children: Whether to include children
+
+        Returns:
+            Tuple[Dict[str, Any], ...]: Extra filter conditions
+        """
+        return cls._add_class_id_filter((), with_children)
+
+    @model_validator(mode='before')
+    @classmethod
+    def fill_deleted_flag(cls, data: Any) -> Any:
+        """
+        Derive the deleted flag from deleted_at when the raw data lacks it
+
+        Documents written before the deleted flag existed load without the field even
+        when deleted_at is set; this keeps is_deleted() correct for them. Data that
+        carries the flag is left alone, so assignments under validate_assignment (e.g.
+        restore() clearing deleted before deleted_at) are never overridden.
+
+        Args:
+            data: Raw input data
+
+        Returns:
+            Any: Input data, with deleted filled in when it was missing
+        """
+        if (
+            isinstance(data, dict)
+            and "deleted" not in data
+            and data.get("deleted_at") is not None
+        ):
+            return {**data, "deleted": True}
+        return data
+
     def is_deleted(self) -> bool:
         """
         Check if the document has been soft deleted
@@ -121,7 +232,7 @@ class DocumentBaseWithSoftDelete(DocumentBase):
         Returns:
             bool: Returns True if document is deleted, otherwise False
         """
-        return self.deleted_at is not None
+        return self.deleted
 
     @classmethod
     def apply_soft_delete_filter(
@@ -133,8 +244,8 @@ class DocumentBaseWithSoftDelete(DocumentBase):
         Apply soft delete filter condition to query filter
 
         This is a utility method used to manually apply soft delete filtering when directly using get_pymongo_collection().
-        If deleted_at condition is already present in filter_query, it remains unchanged.
-        If not present and include_deleted=False, adds deleted_at=None condition.
+        If deleted or deleted_at condition is already present in filter_query, it remains unchanged.
+        If not present and include_deleted=False, adds deleted=False condition.
 
         Args:
             filter_query: Original query filter condition (optional)
@@ -142,75 +253,134 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             Dict[str, Any]: Query condition with soft delete filtering applied
-
-        Example:
-            # Scenario 1: Automatically filter out deleted when using native pymongo API
-            filter_dict = User.apply_soft_delete_filter({"status": "active"})
-            result = await User.get_pymongo_collection().find(filter_dict).to_list(100)
-
-            # Scenario 2: Need to include deleted documents
-            filter_dict = User.apply_soft_delete_filter(
-                {"status": "active"},
-                include_deleted=True
-            )
-            result = await User.get_pymongo_collection().find(filter_dict).to_list(100)
-
-            # Scenario 3: Empty filter condition, only query undeleted
-            filter_dict = User.apply_soft_delete_filter()
-            result = await User.get_pymongo_collection().find(filter_dict).to_list(100)
-
-            # Scenario 4: Using aggregation pipeline
-            match_stage = {"$match": User.apply_soft_delete_filter({"age": {"$gt": 18}})}
-            pipeline = [match_stage, {"$group": {"_id": "$city", "count": {"$sum": 1}}}]
-            result = await User.get_pymongo_collection().aggregate(pipeline).to_list(100)
         """
-        # If no filter condition is provided, create empty dictionary
         if filter_query is None:
-            result_filter = {}
-        else:
-            # Copy original filter condition to avoid modifying original object
-            result_filter = dict(filter_query)
+            return {} if include_deleted else dict(_SOFT_DELETE_PREDICATE)
 
-        # If not including deleted documents, and deleted_at field is not in filter
-        if not include_deleted and "deleted_at" not in result_filter:
-            result_filter["deleted_at"] = None
+        # If not including deleted documents, and no soft delete field is in filter
+        if (
+            not include_deleted
+            and "deleted" not in filter_query
+            and "deleted_at" not in filter_query
+        ):
+            return {**filter_query, **_SOFT_DELETE_PREDICATE}
 
-        return result_filter
+        # Copy original filter condition to avoid modifying original object
+        return dict(filter_query)
 
     @classmethod
-    def get_soft_delete_filter(cls, include_deleted: bool = False) -> Dict[str, Any]:
+    def get_soft_delete_filter(cls, include_deleted: bool = False) -> Mapping[str, Any]:
         """
         Get default soft delete filter condition
 
         This is a simplified utility method that returns pure soft delete filter condition.
 
+        ⚠️ The returned mapping is shared by all callers and read-only.
+        Use get_soft_delete_filter_copy() when a mutable filter is needed.
+
         Args:
             include_deleted: Whether to include deleted documents, default False
 
         Returns:
-            Dict[str, Any]: Soft delete filter condition, returns empty dictionary if include_deleted=True
+            Mapping[str, Any]: Soft delete filter condition, empty if include_deleted=True
+        """
+        if include_deleted:
+            return _NO_SOFT_DELETE_PREDICATE
+        return _SOFT_DELETE_PREDICATE
 
-        Example:
-            # Only get filter condition for undeleted
-            soft_delete_filter = User.get_soft_delete_filter()
-            # Returns: {"deleted_at": None}
+    @classmethod
+    def get_soft_delete_filter_copy(
+        cls, include_deleted: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get default soft delete filter condition as a new dictionary, safe to mutate
 
-            # Get filter condition including deleted (actually returns empty dictionary)
-            all_filter = User.get_soft_delete_filter(include_deleted=True)
-            # Returns: {}
+        Args:
+            include_deleted: Whether to include deleted documents, default False
 
-            # Merge with other conditions
-            my_filter = {"status": "active", **User.get_soft_delete_filter()}
-            result = await User.get_pymongo_collection().find(my_filter).to_list(100)
+        Returns:
+            Dict[str, Any]: Copy of get_soft_delete_filter(include_deleted)
         """
-        if include_deleted:
-            return {}
-        return {"deleted_at": None}
+        return dict(cls.get_soft_delete_filter(include_deleted))
+
+    @classmethod
+    async def migrate_soft_delete_flag(
+        cls, session: Optional[AsyncClientSession] = None
+    ) -> int:
+        """
+        Backfill the deleted flag for documents written before it existed
+
+        One-shot migration helper: documents without the deleted field are invisible
+        to the deleted=False filter, so this must run once per collection before
+        deploying the flag-based queries. Safe to run repeatedly.
+
+        Args:
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            int: Number of documents updated
+        """
+        collection = cls._collection()
+        live = await collection.update_many(
+            {"deleted": {"$exists": False}, "deleted_at": None},
+            {"$set": {"deleted": False}},
+            session=session,
+        )
+        removed = await collection.update_many(
+            {"deleted": {"$exists": False}, "deleted_at": {"$ne": None}},
+            {"$set": {"deleted": True}},
+            session=session,
+        )
+        return live.modified_count + removed.modified_count
+
+    @classmethod
+    @contextmanager
+    def batch_delete_window(cls) -> Iterator[datetime]:
+        """
+        Share one deletion timestamp across all soft deletes in the block
+
+        Inside the window, delete(), bulk_delete() and delete_many() reuse a single
+        timestamp instead of reading the clock per call, so a batch of deletions is
+        stamped uniformly.
+
+        Yields:
+            datetime: Deletion timestamp used in the window
+        """
+        token = _current_delete_timestamp.set(get_now_with_timezone())
+        try:
+            yield _current_delete_timestamp.get()
+        finally:
+            _current_delete_timestamp.reset(token)
+
+    def _build_soft_delete_fields(
+        self, now: datetime, deleted_by: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build the soft delete $set fields for the current document
+
+        Args:
+            now: Deletion timestamp
+            deleted_by: Deletion operator identifier
+
+        Returns:
+            Dict[str, Any]: Field values to write
+        """
+        return {"deleted": True, "deleted_at": now, "deleted_by": deleted_by}
+
+    def _apply_soft_delete_fields(self, fields: Mapping[str, Any]) -> None:
+        """
+        Update current object state with written soft delete fields to maintain consistency
+
+        Args:
+            fields: Field values written to the database
+        """
+        for field_name, value in fields.items():
+            setattr(self, field_name, value)
 
     async def delete(
         self,
         session: Optional[AsyncClientSession] = None,
-        bulk_writer: Optional[Any] = None,
+        bulk_writer: Optional[BulkWriter] = None,
         link_rule: Optional[Any] = None,
         skip_actions: Optional[List[Any]] = None,
         deleted_by: Optional[str] = None,
@@ -221,10 +391,11 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         ⚠️ If document has already been soft deleted, this method returns directly without modifying audit fields.
         ⚠️ Directly uses PyMongo's update_one method, completely bypassing Beanie's save mechanism.
+        ⚠️ When bulk_writer is provided, the update is queued and only written when the writer commits.
 
         Args:
             session: MongoDB session (beanie parameter)
-            bulk_writer: Bulk writer (beanie parameter)
+            bulk_writer: Bulk writer, queues the update instead of executing it immediately
             link_rule: Link rule (beanie parameter)
             skip_actions: Skipped actions (beanie parameter)
             deleted_by: Deletion operator identifier (optional, extended parameter of this class)
@@ -232,45 +403,34 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             None (soft delete does not return DeleteResult)
-
-        Example:
-            doc = await MyDocument.find_one({"name": "test"})
-            await doc.delete(deleted_by="admin")
         """
         # Check if already soft deleted, avoid repeated deletion that would damage audit records
         if self.is_deleted():
             return None
 
-        now = get_now_with_timezone()
-
-        # Set deleted_id to string hash value of document ID
-        # If id is ObjectId, convert to string then take hash
-        deleted_id_value = 0
-        if self.id:
-            # Convert ObjectId to integer (absolute value of hash)
-            deleted_id_value = abs(hash(str(self.id)))
-
-        # Directly use PyMongo's update_one to update database, completely bypassing Beanie
-        await self.get_pymongo_collection().update_one(
-            {"_id": self.id},
-            {
-                "$set": {
-                    "deleted_at": now,
-                    "deleted_by": deleted_by,
-                    "deleted_id": deleted_id_value,
-                }
-            },
-            session=session,
-        )
+        fields = self._build_soft_delete_fields(_get_delete_timestamp(), deleted_by)
+        # Guarded by deleted=False so a stale instance never overwrites the audit fields
+        filter_query = {"_id": self.id, **_SOFT_DELETE_PREDICATE}
 
-        # Update current object state to maintain consistency
-        self.deleted_at = now
-        self.deleted_by = deleted_by
-        self.deleted_id = deleted_id_value
+        if bulk_writer is not None:
+            bulk_writer.add_operation(
+                type(self), UpdateOne(filter_query, {"$set": fields})
+            )
+        else:
+            # Directly use PyMongo's update_one to update database, completely bypassing Beanie
+            await self._collection().update_one(
+                filter_query, {"$set": fields}, session=session
+            )
+
+        self._apply_soft_delete_fields(fields)
 
         return None
 
-    async def restore(self, session: Optional[AsyncClientSession] = None) -> None:
+    async def restore(
+        self,
+        session: Optional[AsyncClientSession] = None,
+        bulk_writer: Optional[BulkWriter] = None,
+    ) -> None:
         """
         Restore a single soft-deleted document
 
@@ -278,32 +438,196 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         ⚠️ If document is not soft deleted, this method returns directly without any operation.
         ⚠️ Directly uses PyMongo's update_one method, completely bypassing Beanie's save mechanism.
-
-        Example:
-            # Find deleted document (using hard_find_one can query including deleted ones)
-            doc = await MyDocument.hard_find_one(
-                {"email": "user@example.com", "deleted_at": {"$ne": None}}
-            )
-
-            # Restore document
-            if doc and doc.is_deleted():
-                await doc.restore()
+        ⚠️ When bulk_writer is provided, the update is queued and only written when the writer commits.
         """
         # If document is not deleted, return directly
         if not self.is_deleted():
             return
 
-        # Directly use PyMongo's update_one to update database, completely bypassing Beanie
-        await self.get_pymongo_collection().update_one(
-            {"_id": self.id},
-            {"$set": {"deleted_at": None, "deleted_by": None, "deleted_id": 0}},
+        # Guarded by deleted=True so only a document that is still deleted is touched
+        filter_query = {"_id": self.id, "deleted": True}
+
+        if bulk_writer is not None:
+            bulk_writer.add_operation(
+                type(self), UpdateOne(filter_query, _RESTORE_UPDATE)
+            )
+        else:
+            # Directly use PyMongo's update_one to update database, completely bypassing Beanie
+            await self._collection().update_one(
+                filter_query, _RESTORE_UPDATE, session=session
+            )
+
+        self._apply_soft_delete_fields(_RESTORE_FIELDS)
+        type(self)._notify_restored()
+
+    @classmethod
+    async def bulk_delete(
+        cls,
+        documents: Iterable["DocumentBaseWithSoftDelete"],
+        deleted_by: Optional[str] = None,
+        ordered: bool = False,
+        session: Optional[AsyncClientSession] = None,
+        **pymongo_kwargs: Any,
+    ) -> Optional[BulkWriteResult]:
+        """
+        Soft delete the given documents with a single bulk_write round trip
+
+        Equivalent to calling doc.delete() on each document, but all updates share one
+        deletion timestamp and are sent to the server together.
+
+        ⚠️ Documents that are already soft deleted or have no id are skipped.
+
+        Args:
+            documents: Documents to soft delete
+            deleted_by: Deletion operator identifier (optional)
+            ordered: Whether the server must apply updates in order, default False
+            session: Optional MongoDB session, for transaction support
+            **pymongo_kwargs: Other parameters passed to PyMongo
+
+        Returns:
+            Optional[BulkWriteResult]: Bulk write result, None if there was nothing to delete
+        """
+        now = _get_delete_timestamp()
+        pending = []
+        operations = []
+        for doc in documents:
+            if doc.id is None or doc.is_deleted():
+                continue
+            fields = doc._build_soft_delete_fields(now, deleted_by)
+            pending.append((doc, fields))
+            operations.append(
+                UpdateOne({"_id": doc.id, **_SOFT_DELETE_PREDICATE}, {"$set": fields})
+            )
+
+        if not operations:
+            return None
+
+        result = await cls._collection().bulk_write(
+            operations, ordered=ordered, session=session, **pymongo_kwargs
+        )
+
+        for doc, fields in pending:
+            doc._apply_soft_delete_fields(fields)
+
+        return result
+
+    @classmethod
+    async def bulk_restore(
+        cls,
+        documents: Iterable["DocumentBaseWithSoftDelete"],
+        ordered: bool = False,
+        session: Optional[AsyncClientSession] = None,
+        **pymongo_kwargs: Any,
+    ) -> Optional[BulkWriteResult]:
+        """
+        Restore the given soft-deleted documents with a single bulk_write round trip
+
+        ⚠️ Documents that are not soft deleted or have no id are skipped.
+
+        Args:
+            documents: Documents to restore
+            ordered: Whether the server must apply updates in order, default False
+            session: Optional MongoDB session, for transaction support
+            **pymongo_kwargs: Other parameters passed to PyMongo
+
+        Returns:
+            Optional[BulkWriteResult]: Bulk write result, None if there was nothing to restore
+        """
+        targets = [doc for doc in documents if doc.id is not None and doc.is_deleted()]
+
+        if not targets:
+            return None
+
+        result = await cls._collection().bulk_write(
+            [
+                UpdateOne({"_id": doc.id, "deleted": True}, _RESTORE_UPDATE)
+                for doc in targets
+            ],
+            ordered=ordered,
             session=session,
+            **pymongo_kwargs,
         )
 
-        # Update current object state to maintain consistency
-        self.deleted_at = None
-        self.deleted_by = None
-        self.deleted_id = 0
+        for doc in targets:
+            doc._apply_soft_delete_fields(_RESTORE_FIELDS)
+        cls._notify_restored()
+
+        return result
+
+    @classmethod
+    async def bulk_delete_by_ids(
+        cls,
+        deletes: Iterable[Tuple[Any, Optional[str]]],
+        now: Optional[datetime] = None,
+        session: Optional[AsyncClientSession] = None,
+    ) -> Set[Any]:
+        """
+        Soft delete documents by _id with a single unordered bulk_write round trip
+
+        Unlike bulk_delete(), the documents do not need to be loaded first. Each
+        (_id, deleted_by) pair becomes one UpdateOne guarded by deleted=False, and all
+        updates share one deletion timestamp.
+
+        Each call also writes a fresh ObjectId to delete_marker, which tells the ids it
+        deleted apart when only some of them matched, whatever other calls (in this or
+        other processes) wrote meanwhile.
+
+        ⚠️ Repeated ids are deleted once, with the deleted_by of their first occurrence.
+
+        Args:
+            deletes: (_id, deleted_by) pairs to soft delete
+            now: Deletion timestamp, default the batch_delete_window() timestamp or
+                the current time
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Set[Any]: _id values soft deleted by this call; missing or already deleted
+            documents are left out
+        """
+        operators: Dict[Any, Optional[str]] = {}
+        for doc_id, deleted_by in deletes:
+            operators.setdefault(doc_id, deleted_by)
+
+        if not operators:
+            return set()
+
+        now = now or _get_delete_timestamp()
+        marker = ObjectId()
+        # One update document per distinct operator, shared by all of its ids
+        updates: Dict[Optional[str], Dict[str, Any]] = {}
+        for deleted_by in operators.values():
+            if deleted_by not in updates:
+                update = _soft_delete_update(now, deleted_by)
+                update["$set"]["delete_marker"] = marker
+                updates[deleted_by] = update
+
+        collection = cls._collection()
+        result = await collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": doc_id, **_SOFT_DELETE_PREDICATE}, updates[deleted_by]
+                )
+                for doc_id, deleted_by in operators.items()
+            ],
+            ordered=False,
+            session=session,
+        )
+
+        if result.modified_count == len(operators):
+            return set(operators)
+        if not result.modified_count:
+            return set()
+
+        # Partial hit: the counts do not say which ids matched, but the documents
+        # deleted here carry this call's marker
+        return {
+            doc["_id"]
+            async for doc in collection.find(
+                {"_id": {"$in": list(operators)}, "delete_marker": marker},
+                projection={"_id": 1},
+                session=session,
+            )
+        }
 
     async def hard_delete(
         self,
@@ -329,10 +653,6 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             Optional[DeleteResult]: Deletion result
-
-        Example:
-            doc = await MyDocument.find_one({"name": "test"})
-            await doc.hard_delete()  # Permanently delete
         """
         return await super().delete(
             session=session,
@@ -357,7 +677,6 @@ class DocumentBaseWithSoftDelete(DocumentBase):
         This supplements the missing functionality in beanie DocumentWithSoftDelete.
 
         ⚠️ Note:
-        - deleted_id is set to microsecond-level timestamp during bulk deletion
         - Automatically filters out already soft-deleted documents to avoid repeated deletion that would damage audit records
 
         Args:
@@ -368,46 +687,14 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             UpdateResult: Update result containing number of matched and modified documents
-
-        Example:
-            # Bulk soft delete
-            result = await User.delete_many(
-                {"is_active": False},
-                deleted_by="admin"
-            )
-            print(f"Soft deleted {result.modified_count} documents")
-
-            # Transactional soft delete using session
-            async with await client.start_session() as session:
-                await User.delete_many(
-                    {"status": "expired"},
-                    deleted_by="system",
-                    session=session
-                )
         """
-        # Set deletion timestamp
-        now = get_now_with_timezone()
-
-        # Note: Handling strategy for deleted_id during bulk deletion
-        # Since bulk operations cannot efficiently set hash value of each document's _id, we use timestamp here
-        # For scenarios requiring strict uniqueness constraints, it is recommended to:
-        # 1. First query all matching documents
-        # 2. Call doc.delete() method individually
-        # Or implement more complex bulk deletion logic at application layer
-
-        update_doc = {
-            "deleted_at": now,
-            "deleted_by": deleted_by,
-            # Use microsecond-level timestamp as deleted_id, providing certain uniqueness
-            # For scenarios requiring strict uniqueness, recommend using individual deletion or custom implementation
-            "deleted_id": int(now.timestamp() * 1000000),  # microsecond-level timestamp
-        }
+        update = _soft_delete_update(_get_delete_timestamp(), deleted_by)
 
         # Apply soft delete filter: only delete documents not already soft deleted, to avoid repeated deletion that would damage audit records
         final_filter = cls.apply_soft_delete_filter(filter_query, include_deleted=False)
 
-        return await cls.get_pymongo_collection().update_many(
-            final_filter, {"$set": update_doc}, session=session, **pymongo_kwargs
+        return await cls._collection().update_many(
+            final_filter, update, session=session, **pymongo_kwargs
         )
 
     @classmethod
@@ -431,32 +718,19 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             UpdateResult: Update result containing number of matched and modified documents
-
-        Example:
-            # Restore specific user
-            result = await User.restore_many({"email": "user@example.com"})
-
-            # Restore all documents deleted yesterday
-            from datetime import timedelta
-            from common_utils.datetime_utils import get_now_with_timezone
-            yesterday = get_now_with_timezone() - timedelta(days=1)
-            result = await User.restore_many(
-                {"deleted_at": {"$gte": yesterday}}
-            )
         """
         # Apply deleted filter: only restore documents that have been soft deleted
         final_filter = cls.apply_soft_delete_filter(filter_query, include_deleted=True)
-        # Manually add condition that deleted_at is not None to ensure only deleted documents are restored
-        if "deleted_at" not in final_filter:
-            final_filter["deleted_at"] = {"$ne": None}
+        # Manually add deleted = True condition to ensure only deleted documents are restored
+        if "deleted" not in final_filter:
+            final_filter["deleted"] = True
 
         # Perform bulk update operation to clear all soft delete markers
-        return await cls.get_pymongo_collection().update_many(
-            final_filter,
-            {"$set": {"deleted_at": None, "deleted_by": None, "deleted_id": 0}},
-            session=session,
-            **pymongo_kwargs,
+        result = await cls._collection().update_many(
+            final_filter, _RESTORE_UPDATE, session=session, **pymongo_kwargs
         )
+        cls._notify_restored()
+        return result
 
     @classmethod
     async def hard_delete_many(
@@ -480,15 +754,215 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             DeleteResult: Deletion result
-
-        Example:
-            # Permanently delete all test data
-            result = await User.hard_delete_many({"is_test": True})
         """
-        return await cls.get_pymongo_collection().delete_many(
+        return await cls._collection().delete_many(
             filter_query, session=session, **pymongo_kwargs
         )
 
+    @classmethod
+    async def _iter_id_batches(
+        cls,
+        filter_query: Mapping[str, Any],
+        batch_size: int,
+        session: Optional[AsyncClientSession] = None,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Iterate _id values of matching documents in lists of at most batch_size
+
+        Reads only _id through a projected cursor, served from the index without
+        fetching documents. The cursor decodes to RawBSONDocument, so each result stays
+        raw bytes and only its _id is decoded.
+
+        Args:
+            filter_query: MongoDB query filter condition
+            batch_size: Maximum number of ids per yielded list
+            session: Optional MongoDB session, for transaction support
+
+        Yields:
+            List[Any]: _id values of the next batch
+        """
+        collection = cls._collection()
+        raw_collection = collection.with_options(
+            codec_options=collection.codec_options.with_options(
+                document_class=RawBSONDocument
+            )
+        )
+        batch = []
+        async for doc in raw_collection.find(
+            filter_query, projection={"_id": 1}, session=session, batch_size=batch_size
+        ):
+            batch.append(doc["_id"])
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    @classmethod
+    async def iter_delete_many_batched(
+        cls,
+        filter_query: Mapping[str, Any],
+        deleted_by: Optional[str] = None,
+        batch_size: int = 2000,
+        session: Optional[AsyncClientSession] = None,
+        **pymongo_kwargs: Any,
+    ) -> AsyncIterator[int]:
+        """
+        Bulk soft delete documents in bounded batches, yielding progress per batch
+
+        Enumerates matching _id values and soft deletes them with one update_many per
+        batch of ids, so each write holds bounded locks and cache instead of covering
+        the whole match in one operation. The next batch is only read and written when
+        the caller asks for it: breaking out of the loop stops the deletion.
+
+        ⚠️ Not atomic: on failure or early exit, batches already issued stay soft deleted.
+
+        Args:
+            filter_query: MongoDB query filter condition
+            deleted_by: Deletion operator identifier (optional)
+            batch_size: Number of ids soft deleted per update_many call
+            session: Optional MongoDB session, for transaction support
+            **pymongo_kwargs: Other parameters passed to PyMongo update_many
+
+        Yields:
+            int: Number of documents soft deleted by each batch
+        """
+        collection = cls._collection()
+        update = _soft_delete_update(_get_delete_timestamp(), deleted_by)
+
+        async for ids in cls._iter_id_batches(
+            cls.apply_soft_delete_filter(filter_query), batch_size, session=session
+        ):
+            # Keep deleted=False so documents deleted concurrently keep their audit fields
+            result = await collection.update_many(
+                {"_id": {"$in": ids}, **_SOFT_DELETE_PREDICATE},
+                update,
+                session=session,
+                **pymongo_kwargs,
+            )
+            yield result.modified_count
+
+    @classmethod
+    async def delete_many_batched(
+        cls,
+        filter_query: Mapping[str, Any],
+        deleted_by: Optional[str] = None,
+        batch_size: int = 2000,
+        concurrency: int = 1,
+        session: Optional[AsyncClientSession] = None,
+        **pymongo_kwargs: Any,
+    ) -> int:
+        """
+        Bulk soft delete documents in bounded batches
+
+        Same effect as delete_many(), but each write covers at most batch_size ids, see
+        iter_delete_many_batched(). Suited for tenants with very large numbers of
+        documents.
+
+        Batches are independent writes, so with concurrency > 1 up to that many
+        update_many calls run at once while the id cursor keeps reading; at most
+        concurrency batches of ids are held in memory. A session cannot run operations
+        concurrently, so batches are always sequential when one is given.
+
+        ⚠️ Not atomic: on failure, batches already issued stay soft deleted.
+
+        Args:
+            filter_query: MongoDB query filter condition
+            deleted_by: Deletion operator identifier (optional)
+            batch_size: Number of ids soft deleted per update_many call
+            concurrency: Maximum number of batches written at the same time, default 1
+            session: Optional MongoDB session, for transaction support
+            **pymongo_kwargs: Other parameters passed to PyMongo update_many
+
+        Returns:
+            int: Total number of soft deleted documents
+        """
+        modified_count = 0
+
+        if concurrency <= 1 or session is not None:
+            async for count in cls.iter_delete_many_batched(
+                filter_query,
+                deleted_by=deleted_by,
+                batch_size=batch_size,
+                session=session,
+                **pymongo_kwargs,
+            ):
+                modified_count += count
+            return modified_count
+
+        collection = cls._collection()
+        update = _soft_delete_update(_get_delete_timestamp(), deleted_by)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def soft_delete_batch(ids: List[Any]) -> None:
+            nonlocal modified_count
+            try:
+                result = await collection.update_many(
+                    {"_id": {"$in": ids}, **_SOFT_DELETE_PREDICATE},
+                    update,
+                    **pymongo_kwargs,
+                )
+                modified_count += result.modified_count
+            finally:
+                semaphore.release()
+
+        # A failed batch cancels the ones in flight and stops the enumeration
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                async for ids in cls._iter_id_batches(
+                    cls.apply_soft_delete_filter(filter_query), batch_size
+                ):
+                    await semaphore.acquire()
+                    task_group.create_task(soft_delete_batch(ids))
+        except* Exception as exc_group:
+            # Surface the first failure itself, as the sequential path does
+            raise exc_group.exceptions[0] from None
+
+        return modified_count
+
+    @classmethod
+    async def hard_delete_many_batched(
+        cls,
+        filter_query: Mapping[str, Any],
+        batch_size: int = 10_000,
+        session: Optional[AsyncClientSession] = None,
+        **pymongo_kwargs: Any,
+    ) -> int:
+        """
+        Bulk hard delete documents in bounded batches (physical deletion)
+
+        ⚠️ Warning: This operation is irreversible! Use with caution.
+
+        Reads only _id of matching documents through a projected cursor (served from the
+        index without fetching documents) and deletes them with one delete_many per batch
+        of ids. Suited for large purges such as date ranges, where a single delete_many
+        would hold the server for the whole collection scan.
+
+        ⚠️ Not atomic: on failure, batches already issued stay deleted.
+
+        Args:
+            filter_query: MongoDB query filter condition
+            batch_size: Number of ids deleted per delete_many call
+            session: Optional MongoDB session, for transaction support
+            **pymongo_kwargs: Other parameters passed to PyMongo delete_many
+
+        Returns:
+            int: Total number of deleted documents
+        """
+        collection = cls._collection()
+        deleted_count = 0
+
+        async for ids in cls._iter_id_batches(
+            filter_query, batch_size, session=session
+        ):
+            result = await collection.delete_many(
+                {"_id": {"$in": ids}}, session=session, **pymongo_kwargs
+            )
+            deleted_count += result.deleted_count
+
+        return deleted_count
+
     @classmethod
     def hard_find_many(  # type: ignore
         cls,
@@ -530,17 +1004,9 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             FindMany query object
-
-        Example:
-            # Find all users including deleted ones
-            all_users = await User.hard_find_many({"email": "test@example.com"}).to_list()
-
-            # Find deleted documents
-            deleted_users = await User.hard_find_many(
-                {"deleted_at": {"$ne": None}}
-            ).to_list()
         """
-        args = cls._add_class_id_filter(args, with_children)
+        if cls._class_id_filters(with_children):
+            args = cls._add_class_id_filter(args, with_children)
         return cls._find_many_query_class(document_model=cls).find_many(
             *args,
             sort=sort,
@@ -585,7 +1051,7 @@ class DocumentBaseWithSoftDelete(DocumentBase):
         """
         Find multiple documents (automatically filters out soft deleted ones)
 
-        This method overrides parent's find_many, automatically adding deleted_at = None filter condition.
+        This method overrides parent's find_many, automatically adding deleted = False filter condition.
         Only returns documents not soft deleted.
 
         Use hard_find_many() if you need to query including deleted documents.
@@ -607,15 +1073,13 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             FindMany query object
-
-        Example:
-            # Only find undeleted users
-            active_users = await User.find_many({"status": "active"}).to_list()
         """
-        # Add deleted_at = None filter condition
-        args = cls._add_class_id_filter(args, with_children) + ({"deleted_at": None},)
+        # Add deleted = False filter condition
+        if cls._class_id_filters(with_children):
+            args = cls._add_class_id_filter(args, with_children)
         return cls._find_many_query_class(document_model=cls).find_many(
             *args,
+            _SOFT_DELETE_PREDICATE,
             sort=sort,
             skip=skip,
             limit=limit,
@@ -662,19 +1126,9 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             FindOne query object
-
-        Example:
-            # Find user including deleted ones
-            user = await User.hard_find_one({"email": "test@example.com"})
-
-            # Find deleted user and restore
-            deleted_user = await User.hard_find_one(
-                {"email": "test@example.com", "deleted_at": {"$ne": None}}
-            )
-            if deleted_user:
-                await deleted_user.restore()
         """
-        args = cls._add_class_id_filter(args, with_children)
+        if cls._class_id_filters(with_children):
+            args = cls._add_class_id_filter(args, with_children)
         return cls._find_one_query_class(document_model=cls).find_one(
             *args,
             projection_model=projection_model,
@@ -702,7 +1156,7 @@ class DocumentBaseWithSoftDelete(DocumentBase):
         """
         Find single document (automatically filters out soft deleted ones)
 
-        This method overrides parent's find_one, automatically adding deleted_at = None filter condition.
+        This method overrides parent's find_one, automatically adding deleted = False filter condition.
         Only returns documents not soft deleted.
 
         Use hard_find_one() if you need to query including deleted documents.
@@ -720,15 +1174,13 @@ class DocumentBaseWithSoftDelete(DocumentBase):
 
         Returns:
             FindOne query object
-
-        Example:
-            # Find undeleted user
-            user = await User.find_one({"email": "test@example.com"})
         """
-        # Add deleted_at = None filter condition
-        args = cls._add_class_id_filter(args, with_children) + ({"deleted_at": None},)
+        # Add deleted = False filter condition
+        if cls._class_id_filters(with_children):
+            args = cls._add_class_id_filter(args, with_children)
         return cls._find_one_query_class(document_model=cls).find_one(
             *args,
+            _SOFT_DELETE_PREDICATE,
             projection_model=projection_model,
             session=session,
             ignore_cache=ignore_cache,
@@ -738,8 +1190,45 @@ class DocumentBaseWithSoftDelete(DocumentBase):
             **pymongo_kwargs,
         )
 
+    @classmethod
+    def find_one_simple(cls, filter_query: Mapping[str, Any]):
+        """
+        Find single undeleted document by a plain filter (fast path of find_one())
+
+        Equivalent to find_one(filter_query) without projection, session, link fetching
+        or nesting options, skipping the keyword plumbing of the generic override.
+        Use find_one() whenever any of those options is needed.
+
+        Args:
+            filter_query: MongoDB query filter condition
+
+        Returns:
+            FindOne query object
+        """
+        query = cls._find_one_query_class(document_model=cls)
+        class_id_filters = cls._class_id_filters(False)
+        if class_id_filters:
+            return query.find_one(
+                filter_query,
+                *class_id_filters,
+                _SOFT_DELETE_PREDICATE,
+                ignore_cache=True,
+            )
+        return query.find_one(filter_query, _SOFT_DELETE_PREDICATE, ignore_cache=True)
+
     class Settings:
-        """Document settings"""
+        """
+        Document settings
+
+        Subclasses should index the soft delete flag together with their query fields,
+        since every find_one()/find_many() call adds deleted=False to the filter:
+            indexes = [
+                IndexModel([("deleted", 1), ("user_id", 1)]),
+            ]
+
+        Collections created before the deleted flag existed need a one-shot
+        migrate_soft_delete_flag() run before the index becomes effective.
+        """
 
         # Common document configurations can be set here
         # For example: indexes, validation rules, etc
@@ -4,53 +4,67 @@ Memory API DTO
 
 Request and response data transfer objects for Memory API.
 These models are re-exported from api_specs.dtos for backward compatibility.
+Names are resolved lazily on first access (PEP 562).
 """
 
-# Re-export from api_specs.dtos
-from api_specs.dtos import (
-    # Base API Response
-    BaseApiResponse,
-    # Command DTOs
-    MemorizeMessageRequest,
-    DeleteMemoriesRequest as DeleteMemoriesRequestDTO,
-    # Request DTOs
-    FetchMemRequest,
-    RetrieveMemRequest,
-    UserDetail,
-    ConversationMetaCreateRequest,
-    ConversationMetaGetRequest,
-    ConversationMetaPatchRequest,
-    # Response DTOs (result data)
-    FetchMemResponse,
-    RetrieveMemResponse,
-    ConversationMetaResponse,
-    PatchConversationMetaResult,
-    DeleteMemoriesResult,
-    MemorizeResult,
-    # === BEGIN: 非官方扩展 ===
-    # 添加时间：2026-02-16
-    # 开发者：HPC2H2
-    # 用途：处理待清理的 pending 消息
-    # 状态：实验性功能，可能在未来版本移除
-    ClearPendingRequest,
-    ClearPendingResult,
-    # API Response wrappers
-    MemorizeResponse,
-    FetchMemoriesResponse,
-    SearchMemoriesResponse,
-    GetConversationMetaResponse,
-    SaveConversationMetaResponse,
-    PatchConversationMetaResponse,
-    DeleteMemoriesResponse,
-    ClearPendingResponse,
-    # === END: 非官方扩展 ===
-)
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Re-export from api_specs.dtos
+    from api_specs.dtos import (
+        # Base API Response
+        BaseApiResponse,
+        # Command DTOs
+        MemorizeMessageRequest,
+        DeleteMemoriesRequest as DeleteMemoriesRequestDTO,
+        # Request DTOs
+        FetchMemRequest,
+        RetrieveMemRequest,
+        UserDetail,
+        ConversationMetaCreateRequest,
+        ConversationMetaGetRequest,
+        ConversationMetaPatchRequest,
+        # Response DTOs (result data)
+        FetchMemResponse,
+        RetrieveMemResponse,
+        ConversationMetaResponse,
+        PatchConversationMetaResult,
+        DeleteMemoriesResult,
+        MemorizeResult,
+        # === BEGIN: 非官方扩展 ===
+        # 添加时间：2026-02-16
+        # 开发者：HPC2H2
+        # 用途：处理待清理的 pending 消息
+        # 状态：实验性功能，可能在未来版本移除
+        ClearPendingRequest,
+        ClearPendingResult,
+        # API Response wrappers
+        MemorizeResponse,
+        FetchMemoriesResponse,
+        SearchMemoriesResponse,
+        GetConversationMetaResponse,
+        SaveConversationMetaResponse,
+        PatchConversationMetaResponse,
+        DeleteMemoriesResponse,
+        ClearPendingResponse,
+        # === END: 非官方扩展 ===
+    )
+
+    # Backward compatibility aliases
+    FetchMemoriesParams = FetchMemRequest
+    SearchMemoriesRequest = RetrieveMemRequest
+    UserDetailRequest = UserDetail
+    DeleteMemoriesRequest = DeleteMemoriesRequestDTO
 
-# Backward compatibility aliases
-FetchMemoriesParams = FetchMemRequest
-SearchMemoriesRequest = RetrieveMemRequest
-UserDetailRequest = UserDetail
-DeleteMemoriesRequest = DeleteMemoriesRequestDTO
+# Backward compatibility aliases: exported name -> name in api_specs.dtos
+_ALIASES = {
+    "FetchMemoriesParams": "FetchMemRequest",
+    "SearchMemoriesRequest": "RetrieveMemRequest",
+    "UserDetailRequest": "UserDetail",
+    "DeleteMemoriesRequestDTO": "DeleteMemoriesRequest",
+}
 
 __all__ = [
     # Base Response
@@ -89,3 +103,21 @@ __all__ = [
     "SearchMemoriesRequest",
     "UserDetailRequest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve `name` from api_specs.dtos on first access and cache the result."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Peek at sys.modules first to skip the import machinery once loaded
+    package = sys.modules.get("api_specs.dtos") or importlib.import_module(
+        "api_specs.dtos"
+    )
+    value = getattr(package, _ALIASES.get(name, name))
+    # Later lookups hit the module dict and never reach __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
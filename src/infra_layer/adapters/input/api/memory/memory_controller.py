@@ -1131,6 +1131,9 @@ class MemoryController(BaseController):
         - Records are marked as deleted, not physically removed
         - Deleted records can be restored if needed
         - Deleted records won't appear in regular queries
+        - With MEMCELL_DELETE_CACHE_ENABLED=true, repeating a successful delete that
+          includes event_id within 5 minutes returns 200 with count=1 (the cached
+          first result) instead of 404
         
         ## Use cases:
         - User requests data deletion
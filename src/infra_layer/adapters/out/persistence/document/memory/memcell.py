@@ -171,31 +171,27 @@ class MemCell(DocumentBaseWithSoftDelete, AuditBase):
 
         # Index definitions
         indexes = [
-            # 1. Soft delete support - soft delete status index
-            IndexModel(
-                [("deleted_at", ASCENDING)],
-                name="idx_deleted_at",
-                sparse=True,  # Only index documents that are deleted
-            ),
+            # 1. Soft delete support - covered by the deleted flag in the composite
+            # indexes below; idx_deleted_at is dropped by the soft delete flag migration
             # 2. Composite index for user queries - core query pattern
-            # Includes deleted_at to optimize soft delete filtering
+            # Includes the deleted flag to optimize soft delete filtering
             IndexModel(
                 [
                     ("user_id", ASCENDING),
-                    ("deleted_at", ASCENDING),
+                    ("deleted", ASCENDING),
                     ("timestamp", DESCENDING),
                 ],
-                name="idx_user_deleted_timestamp",
+                name="idx_user_deleted_flag_timestamp",
             ),
             # 3. Composite index for group queries - optimized for group chat scenarios
-            # Includes deleted_at to optimize soft delete filtering
+            # Includes the deleted flag to optimize soft delete filtering
             IndexModel(
                 [
                     ("group_id", ASCENDING),
-                    ("deleted_at", ASCENDING),
+                    ("deleted", ASCENDING),
                     ("timestamp", DESCENDING),
                 ],
-                name="idx_group_deleted_timestamp",
+                name="idx_group_deleted_flag_timestamp",
             ),
             # 4. Index for time range queries (shard key, automatically created by MongoDB)
             # Note: Shard key index is automatically created, no need to define manually
@@ -209,20 +205,20 @@ class MemCell(DocumentBaseWithSoftDelete, AuditBase):
                 [
                     ("user_id", ASCENDING),
                     ("type", ASCENDING),
-                    ("deleted_at", ASCENDING),
+                    ("deleted", ASCENDING),
                     ("timestamp", DESCENDING),
                 ],
-                name="idx_user_type_deleted_timestamp",
+                name="idx_user_type_deleted_flag_timestamp",
             ),
             # 7. Composite index for group-type queries - optimized for group data type filtering
             IndexModel(
                 [
                     ('group_id', ASCENDING),
                     ("type", ASCENDING),
-                    ("deleted_at", ASCENDING),
+                    ("deleted", ASCENDING),
                     ("timestamp", DESCENDING),
                 ],
-                name="idx_group_type_deleted_timestamp",
+                name="idx_group_type_deleted_flag_timestamp",
             ),
             # Creation time index
             IndexModel([("created_at", DESCENDING)], name="idx_created_at"),
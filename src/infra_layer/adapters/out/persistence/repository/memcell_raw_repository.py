@@ -5,8 +5,11 @@ Native data access layer for MemCell based on Beanie ODM, providing complete CRU
 Does not depend on domain layer interfaces, directly operates on MemCell document models.
 """
 
+import os
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Type
+from typing import List, Optional, Dict, Any, AsyncIterator, Hashable, Set, Tuple, Type
 from bson import ObjectId
 from pydantic import BaseModel
 from beanie.operators import And, GTE, LT, Eq, RegEx, Or
@@ -23,6 +26,64 @@ from infra_layer.adapters.out.persistence.document.memory.memcell import (
 logger = get_logger(__name__)
 
 
+class _DeleteResultCache:
+    """
+    Bounded LRU cache of successful delete results with per-entry expiry
+
+    Only used from the event loop, with no await between lookup and update, so it
+    needs no lock.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries, least recently used ones are evicted first
+            ttl_seconds: Lifetime of each entry in seconds
+        """
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a live entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one when full
+
+        Args:
+            key: Cache key
+            value: Value to cache, must not be None
+        """
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+
 @repository("memcell_raw_repository", primary=True)
 class MemCellRawRepository(BaseRepository[MemCell]):
     """
@@ -36,9 +97,54 @@ class MemCellRawRepository(BaseRepository[MemCell]):
     - Transaction management (inherited from BaseRepository)
     """
 
+    # Successful deletes are remembered so replays (at-least-once handlers, retention
+    # retries) are answered without a database round trip
+    DELETE_RESULT_CACHE_SIZE = 512
+    DELETE_RESULT_CACHE_TTL_SECONDS = 300.0
+
     def __init__(self):
         """Initialize repository"""
         super().__init__(MemCell)
+        self._delete_results = _DeleteResultCache(
+            self.DELETE_RESULT_CACHE_SIZE, self.DELETE_RESULT_CACHE_TTL_SECONDS
+        )
+        # The cache only sees restores made in this process, so it is opt-in for
+        # deployments where a single process serves every delete and restore
+        cache_enabled = os.getenv("MEMCELL_DELETE_CACHE_ENABLED", "false")
+        self._delete_cache_enabled = cache_enabled.lower() == "true"
+        MemCell.add_restore_listener(self._delete_results.clear)
+
+    def get_cached_delete_result(self, key: Hashable) -> Optional[Any]:
+        """
+        Get the cached result of a recent successful delete
+
+        Every MemCell restore in this process (restore(), bulk_restore() or
+        restore_many(), through this repository or not) drops all entries, so a replay
+        after a restore always reaches the database. Restores made by other processes
+        are not seen, hence the cache is disabled unless MEMCELL_DELETE_CACHE_ENABLED
+        is true.
+
+        Args:
+            key: Cache key chosen by the caller
+
+        Returns:
+            Cached result, or None if disabled, missing, expired or invalidated by a
+            restore
+        """
+        if not self._delete_cache_enabled:
+            return None
+        return self._delete_results.get(key)
+
+    def cache_delete_result(self, key: Hashable, result: Any) -> None:
+        """
+        Remember the result of a successful delete, see get_cached_delete_result()
+
+        Args:
+            key: Cache key chosen by the caller
+            result: Delete result, must not be None
+        """
+        if self._delete_cache_enabled:
+            self._delete_results.put(key, result)
 
     async def get_by_event_id(self, event_id: str) -> Optional[MemCell]:
         """
@@ -51,7 +157,7 @@ class MemCellRawRepository(BaseRepository[MemCell]):
             MemCell instance or None
         """
         try:
-            result = await self.model.find_one({"_id": ObjectId(event_id)})
+            result = await self.model.find_one_simple({"_id": ObjectId(event_id)})
             if result:
                 logger.debug(
                     "✅ Successfully retrieved MemCell by event_id: %s", event_id
@@ -202,6 +308,85 @@ class MemCellRawRepository(BaseRepository[MemCell]):
             logger.error("❌ Failed to soft delete MemCell by event_id: %s", e)
             return False
 
+    async def bulk_delete_by_event_ids(
+        self,
+        deletes: List[Tuple[ObjectId, Optional[str]]],
+        now: Optional[datetime] = None,
+        session: Optional[AsyncClientSession] = None,
+    ) -> Set[ObjectId]:
+        """
+        Soft delete MemCell by (event_id, deleted_by) pairs in one bulk write
+
+        Args:
+            deletes: (event ObjectId, deleter) pairs
+            now: Deletion timestamp, default the current time
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Set of event ObjectIds that were soft deleted
+
+        Raises:
+            Exception: Database errors are propagated so each caller can be notified
+        """
+        deleted_ids = await self.model.bulk_delete_by_ids(
+            deletes, now=now, session=session
+        )
+        logger.debug(
+            "✅ Bulk soft deleted MemCell by event_id: %d of %d",
+            len(deleted_ids),
+            len(deletes),
+        )
+        return deleted_ids
+
+    async def delete_by_event_ids(
+        self,
+        event_ids: List[str],
+        deleted_by: Optional[str] = None,
+        batch_size: int = 2000,
+        session: Optional[AsyncClientSession] = None,
+    ) -> int:
+        """
+        Batch soft delete MemCell by event_id list, one update_many per batch of ids
+
+        All batches share one deletion timestamp.
+
+        Args:
+            event_ids: List of event IDs, invalid ones are skipped
+            deleted_by: Deleter (optional)
+            batch_size: Maximum number of ids per update_many call
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Number of soft deleted records
+
+        Raises:
+            Exception: Database errors are propagated to the caller
+        """
+        object_ids = [
+            ObjectId(event_id) for event_id in event_ids if ObjectId.is_valid(event_id)
+        ]
+        if len(object_ids) < len(event_ids):
+            logger.warning(
+                "⚠️  Skipped %d invalid event_ids", len(event_ids) - len(object_ids)
+            )
+
+        modified_count = 0
+        with self.model.batch_delete_window():
+            for start in range(0, len(object_ids), batch_size):
+                result = await self.model.delete_many(
+                    {"_id": {"$in": object_ids[start : start + batch_size]}},
+                    deleted_by=deleted_by,
+                    session=session,
+                )
+                modified_count += result.modified_count
+
+        logger.debug(
+            "✅ Successfully batch soft deleted MemCell by event_ids: requested %d, deleted %d",
+            len(event_ids),
+            modified_count,
+        )
+        return modified_count
+
     async def hard_delete_by_event_id(
         self, event_id: str, session: Optional[AsyncClientSession] = None
     ) -> bool:
@@ -521,6 +706,100 @@ class MemCellRawRepository(BaseRepository[MemCell]):
 
     # ==================== Batch Operations ====================
 
+    async def soft_delete_in_batches(
+        self,
+        filter_dict: Dict[str, Any],
+        deleted_by: Optional[str] = None,
+        batch_size: int = 2000,
+        concurrency: int = 16,
+        session: Optional[AsyncClientSession] = None,
+    ) -> int:
+        """
+        Soft delete matching MemCell in bounded batches of ids
+
+        Each batch is one update_many over at most batch_size ids, so large users or
+        groups never turn into a single unbounded write. Up to concurrency batches are
+        written in parallel (sequential when a session is given).
+
+        Args:
+            filter_dict: MongoDB query filter condition
+            deleted_by: Deleter (optional)
+            batch_size: Number of records soft deleted per batch
+            concurrency: Maximum number of batches written at the same time
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Number of soft deleted records
+        """
+        return await self.model.delete_many_batched(
+            filter_dict,
+            deleted_by=deleted_by,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            session=session,
+        )
+
+    def iter_soft_delete_in_batches(
+        self,
+        filter_dict: Dict[str, Any],
+        deleted_by: Optional[str] = None,
+        batch_size: int = 2000,
+        session: Optional[AsyncClientSession] = None,
+    ) -> AsyncIterator[int]:
+        """
+        Soft delete matching MemCell in bounded batches of ids, yielding per batch
+
+        Same as soft_delete_in_batches(), but the caller drives the batches and can
+        report progress or stop early. Errors are propagated to the caller.
+
+        Args:
+            filter_dict: MongoDB query filter condition
+            deleted_by: Deleter (optional)
+            batch_size: Number of records soft deleted per batch
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Async iterator of the number of records soft deleted by each batch
+        """
+        return self.model.iter_delete_many_batched(
+            filter_dict, deleted_by=deleted_by, batch_size=batch_size, session=session
+        )
+
+    async def _soft_delete_by_field(
+        self,
+        field: str,
+        value: str,
+        deleted_by: Optional[str] = None,
+        session: Optional[AsyncClientSession] = None,
+    ) -> int:
+        """
+        Soft delete all MemCell whose field equals value, in bounded id batches
+
+        Shared implementation of delete_by_user_id() and delete_by_group_id().
+
+        Args:
+            field: MemCell field to match
+            value: Value of the field
+            deleted_by: Deleter (optional)
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Number of soft deleted records
+
+        Raises:
+            Exception: Database errors are propagated to the caller
+        """
+        count = await self.soft_delete_in_batches(
+            {field: value}, deleted_by=deleted_by, session=session
+        )
+        logger.info(
+            "✅ Successfully soft deleted all MemCell by %s: %s, deleted %d records",
+            field,
+            value,
+            count,
+        )
+        return count
+
     async def delete_by_user_id(
         self,
         user_id: str,
@@ -537,21 +816,37 @@ class MemCellRawRepository(BaseRepository[MemCell]):
 
         Returns:
             Number of soft deleted records
+
+        Raises:
+            Exception: Database errors are propagated to the caller
         """
-        try:
-            result = await self.model.delete_many(
-                {"user_id": user_id}, deleted_by=deleted_by, session=session
-            )
-            count = result.modified_count if result else 0
-            logger.info(
-                "✅ Successfully soft deleted all MemCell of user: %s, deleted %d records",
-                user_id,
-                count,
-            )
-            return count
-        except Exception as e:
-            logger.error("❌ Failed to soft delete all MemCell of user: %s", e)
-            return 0
+        return await self._soft_delete_by_field(
+            "user_id", user_id, deleted_by=deleted_by, session=session
+        )
+
+    async def delete_by_group_id(
+        self,
+        group_id: str,
+        deleted_by: Optional[str] = None,
+        session: Optional[AsyncClientSession] = None,
+    ) -> int:
+        """
+        Soft delete all MemCell of a group
+
+        Args:
+            group_id: Group ID
+            deleted_by: Deleter (optional)
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Number of soft deleted records
+
+        Raises:
+            Exception: Database errors are propagated to the caller
+        """
+        return await self._soft_delete_by_field(
+            "group_id", group_id, deleted_by=deleted_by, session=session
+        )
 
     async def hard_delete_by_user_id(
         self, user_id: str, session: Optional[AsyncClientSession] = None
@@ -651,8 +946,9 @@ class MemCellRawRepository(BaseRepository[MemCell]):
             if user_id:
                 filter_dict["user_id"] = user_id
 
-            result = await self.model.hard_delete_many(filter_dict, session=session)
-            count = result.deleted_count if result else 0
+            count = await self.model.hard_delete_many_batched(
+                filter_dict, session=session
+            )
             logger.info(
                 "✅ Successfully hard deleted MemCell within time range: %s - %s, user: %s, deleted %d records",
                 start_time,
@@ -744,7 +1040,7 @@ class MemCellRawRepository(BaseRepository[MemCell]):
         try:
             filter_dict = {
                 "timestamp": {"$gte": start_time, "$lt": end_time},
-                "deleted_at": {"$ne": None},  # Only restore deleted records
+                "deleted": True,  # Only restore deleted records
             }
             if user_id:
                 filter_dict["user_id"] = user_id
@@ -0,0 +1,73 @@
+"""
+Memcell Soft Delete Flag
+
+Backfills the boolean deleted flag on MemCells written before it existed, since the
+deleted=False filter of every read does not match documents without the field, and
+drops the indexes replaced by the flag-based ones.
+
+Created at: 2026-10-15T12:00:00+08:00
+"""
+
+from beanie import free_fall_migration
+from pymongo import IndexModel, ASCENDING, DESCENDING
+
+from infra_layer.adapters.out.persistence.document.memory.memcell import MemCell
+
+# Indexes keyed on deleted_at, superseded by the idx_*_deleted_flag_timestamp ones
+_REPLACED_INDEXES = [
+    IndexModel([("deleted_at", ASCENDING)], name="idx_deleted_at", sparse=True),
+    IndexModel(
+        [("user_id", ASCENDING), ("deleted_at", ASCENDING), ("timestamp", DESCENDING)],
+        name="idx_user_deleted_timestamp",
+    ),
+    IndexModel(
+        [("group_id", ASCENDING), ("deleted_at", ASCENDING), ("timestamp", DESCENDING)],
+        name="idx_group_deleted_timestamp",
+    ),
+    IndexModel(
+        [
+            ("user_id", ASCENDING),
+            ("type", ASCENDING),
+            ("deleted_at", ASCENDING),
+            ("timestamp", DESCENDING),
+        ],
+        name="idx_user_type_deleted_timestamp",
+    ),
+    IndexModel(
+        [
+            ("group_id", ASCENDING),
+            ("type", ASCENDING),
+            ("deleted_at", ASCENDING),
+            ("timestamp", DESCENDING),
+        ],
+        name="idx_group_type_deleted_timestamp",
+    ),
+]
+
+
+class Forward:
+    """Forward migration"""
+
+    @free_fall_migration(document_models=[MemCell])
+    async def backfill_deleted_flag(self, session):
+        await MemCell.migrate_soft_delete_flag(session=session)
+
+    @free_fall_migration(document_models=[MemCell])
+    async def drop_replaced_indexes(self, session):
+        collection = MemCell.get_pymongo_collection()
+        existing = await collection.index_information()
+        for index in _REPLACED_INDEXES:
+            name = index.document["name"]
+            if name in existing:
+                await collection.drop_index(name)
+
+
+class Backward:
+    """Backward migration"""
+
+    # The backfilled flag is left in place: older code ignores it
+
+    @free_fall_migration(document_models=[MemCell])
+    async def recreate_replaced_indexes(self, session):
+        collection = MemCell.get_pymongo_collection()
+        await collection.create_indexes(_REPLACED_INDEXES)
@@ -3,24 +3,75 @@ MemCell Delete Service - Handle soft delete logic for MemCell
 
 Provides multiple deletion methods:
 - Delete by single event_id
+- Batch delete by event_id list
 - Batch delete by user_id
 - Batch delete by group_id
+- Batch delete by user_id or group_id with per-batch progress
 """
 
-from typing import Optional
+import asyncio
+import contextvars
+import logging
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from bson import ObjectId
+from common_utils.datetime_utils import get_now_with_timezone
 from core.di.decorators import component
 from core.observation.logger import get_logger
+from core.oxm.constants import MAGIC_ALL
+from infra_layer.adapters.out.persistence.document.memory.memcell import MemCell
 from infra_layer.adapters.out.persistence.repository.memcell_raw_repository import (
     MemCellRawRepository,
 )
 
 logger = get_logger(__name__)
 
+# Pending event_id delete: (event ObjectId, deleter, future resolved with the outcome)
+_PendingEventDelete = Tuple[ObjectId, Optional[str], "asyncio.Future[bool]"]
+
+# delete_by_combined_criteria failure results, shared: only returned as copies
+_EMPTY_CRITERIA_RESULT: Dict[str, Any] = {
+    "filters": [],
+    "count": 0,
+    "success": False,
+    "error": "No deletion criteria provided",
+}
+_INVALID_EVENT_ID_RESULT: Dict[str, Any] = {"filters": [], "count": 0, "success": False}
+# delete_by_combined_criteria values meaning "criterion not set"
+_UNSET_CRITERIA = frozenset({None, "", MAGIC_ALL})
+# MemCell field of each delete_by_combined_criteria filter -> criterion name reported back
+_CRITERIA_LABELS: Dict[str, str] = {
+    "_id": "event_id",
+    "user_id": "user_id",
+    "group_id": "group_id",
+}
+
+
+@lru_cache(maxsize=4096)
+def _to_object_id(event_id: str) -> Optional[ObjectId]:
+    """
+    Parse an event_id, memoized so replayed and retried deletes skip the hex parse
+
+    ObjectId is immutable, so cached instances are safe to share.
+
+    Args:
+        event_id: Hex string event_id
+
+    Returns:
+        Optional[ObjectId]: Parsed id, or None if event_id is not a valid ObjectId
+    """
+    return ObjectId(event_id) if ObjectId.is_valid(event_id) else None
+
 
 @component("memcell_delete_service")
 class MemCellDeleteService:
     """MemCell soft delete service"""
 
+    # Concurrent delete_by_event_id calls arriving within this window share one bulk write
+    EVENT_DELETE_WINDOW_SECONDS = 0.003
+    # Maximum number of event_id deletes per bulk write
+    EVENT_DELETE_MAX_BATCH = 500
+
     def __init__(self, memcell_repository: MemCellRawRepository):
         """
         Initialize deletion service
@@ -29,17 +80,140 @@ class MemCellDeleteService:
             memcell_repository: MemCell data repository
         """
         self.memcell_repository = memcell_repository
+        # Created lazily on first use: no event loop is running when DI builds the service
+        self._event_delete_queue: Optional["asyncio.Queue[_PendingEventDelete]"] = None
+        self._event_delete_worker: Optional[asyncio.Task] = None
+        self._event_delete_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info("MemCellDeleteService initialized")
 
+    def _get_event_delete_queue(self) -> "asyncio.Queue[_PendingEventDelete]":
+        """
+        Get the event_id delete queue, starting its worker on the running loop if needed
+
+        The worker runs in an empty context, so it never inherits the contextvars (e.g.
+        a batch_delete_window() timestamp) of the call that happened to start it.
+
+        Returns:
+            asyncio.Queue: Queue consumed by the coalescing worker
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._event_delete_queue is None
+            or self._event_delete_loop is not loop
+            or self._event_delete_worker.done()
+        ):
+            self._event_delete_queue = asyncio.Queue()
+            self._event_delete_loop = loop
+            self._event_delete_worker = loop.create_task(
+                self._run_event_delete_worker(self._event_delete_queue),
+                context=contextvars.Context(),
+            )
+        return self._event_delete_queue
+
+    async def close(self) -> None:
+        """
+        Stop the event_id delete worker
+
+        Deletes still queued or in flight fail with RuntimeError. A later
+        delete_by_event_id() starts a new worker.
+        """
+        worker = self._event_delete_worker
+        self._event_delete_queue = None
+        self._event_delete_worker = None
+        self._event_delete_loop = None
+        if worker is None or worker.done():
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+
+    async def _run_event_delete_worker(
+        self, queue: "asyncio.Queue[_PendingEventDelete]"
+    ) -> None:
+        """
+        Drain the event_id delete queue in coalesced batches
+
+        Waits for one pending delete, then keeps collecting for up to
+        EVENT_DELETE_WINDOW_SECONDS or EVENT_DELETE_MAX_BATCH items and flushes them
+        together. When the worker stops, every delete it has not resolved fails, so no
+        caller waits forever.
+
+        Args:
+            queue: Queue filled by delete_by_event_id
+        """
+        loop = asyncio.get_running_loop()
+        batch: List[_PendingEventDelete] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.EVENT_DELETE_WINDOW_SECONDS
+                while len(batch) < self.EVENT_DELETE_MAX_BATCH:
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._flush_event_deletes(batch)
+                batch = []
+        finally:
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("MemCell delete worker stopped"))
+
+    async def _flush_event_deletes(self, batch: List[_PendingEventDelete]) -> None:
+        """
+        Soft delete a batch of pending event_id deletes and resolve their futures
+
+        Each future gets True if its MemCell was soft deleted by this batch. A repeated
+        event_id only counts for its first request, as if the calls had run one by one.
+        The batch is stamped with its own deletion timestamp.
+
+        Args:
+            batch: Pending deletes collected by the worker
+        """
+        try:
+            deleted_ids = await self.memcell_repository.bulk_delete_by_event_ids(
+                [(object_id, deleted_by) for object_id, deleted_by, _ in batch],
+                now=get_now_with_timezone(),
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for object_id, _, future in batch:
+            deleted = object_id in deleted_ids
+            deleted_ids.discard(object_id)
+            # The caller may have been cancelled while waiting
+            if not future.done():
+                future.set_result(deleted)
+
     async def delete_by_event_id(
-        self, event_id: str, deleted_by: Optional[str] = None
+        self, event_id: str, deleted_by: Optional[str] = None, force: bool = False
     ) -> bool:
         """
         Soft delete a single MemCell by event_id
 
+        Concurrent calls are coalesced into one bulk write, see _run_event_delete_worker().
+        A replay of a recent successful delete by the same deleter returns True from
+        the repository's result cache without touching the database, until the entry
+        expires or a restore through MemCellRawRepository invalidates it.
+
         Args:
             event_id: The event_id of MemCell
             deleted_by: Identifier of the deleter (optional)
+            force: Skip the result cache (restores through the repository already
+                invalidate it)
 
         Returns:
             bool: Returns True if deletion succeeds, False if not found or already deleted
@@ -48,23 +222,36 @@ class MemCellDeleteService:
             >>> service = MemCellDeleteService(repo)
             >>> success = await service.delete_by_event_id("507f1f77bcf86cd799439011", "admin")
         """
-        logger.info(
+        # Per-event hot path: the outcome below is the INFO record, the entry is DEBUG
+        logger.debug(
             "Deleting MemCell by event_id: event_id=%s, deleted_by=%s",
             event_id,
             deleted_by,
         )
 
+        object_id = _to_object_id(event_id)
+        if object_id is None:
+            logger.warning("Invalid event_id format: %s", event_id)
+            return False
+
+        cache_key = ("evt", object_id, deleted_by)
+        if not force and self.memcell_repository.get_cached_delete_result(cache_key):
+            logger.debug("MemCell delete served from cache: event_id=%s", event_id)
+            return True
+
         try:
-            result = await self.memcell_repository.delete_by_event_id(
-                event_id=event_id, deleted_by=deleted_by
-            )
+            future = asyncio.get_running_loop().create_future()
+            self._get_event_delete_queue().put_nowait((object_id, deleted_by, future))
+            result = await future
 
             if result:
-                logger.info(
-                    "Successfully deleted MemCell: event_id=%s, deleted_by=%s",
-                    event_id,
-                    deleted_by,
-                )
+                self.memcell_repository.cache_delete_result(cache_key, True)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Successfully deleted MemCell: event_id=%s, deleted_by=%s",
+                        event_id,
+                        deleted_by,
+                    )
             else:
                 logger.warning(
                     "MemCell not found or already deleted: event_id=%s", event_id
@@ -74,45 +261,42 @@ class MemCellDeleteService:
 
         except Exception as e:
             logger.error(
-                "Failed to delete MemCell by event_id: event_id=%s, error=%s",
+                "Failed to delete MemCell by event_id: event_id=%s, error=%r",
                 event_id,
                 e,
-                exc_info=True,
             )
             raise
 
-    async def delete_by_user_id(
-        self, user_id: str, deleted_by: Optional[str] = None
+    async def delete_by_event_ids(
+        self, event_ids: List[str], deleted_by: Optional[str] = None
     ) -> int:
         """
-        Batch soft delete all MemCells of a user by user_id
+        Batch soft delete MemCells by a list of event_ids in bounded batches
+
+        Prefer this over calling delete_by_event_id() in a loop when the ids are known
+        up front. Invalid event_ids are skipped.
 
         Args:
-            user_id: User ID
+            event_ids: The event_ids of MemCells
             deleted_by: Identifier of the deleter (optional)
 
         Returns:
             int: Number of deleted records
-
-        Example:
-            >>> service = MemCellDeleteService(repo)
-            >>> count = await service.delete_by_user_id("user_123", "admin")
-            >>> print(f"Deleted {count} records")
         """
         logger.info(
-            "Deleting MemCells by user_id: user_id=%s, deleted_by=%s",
-            user_id,
+            "Deleting MemCells by event_ids: count=%d, deleted_by=%s",
+            len(event_ids),
             deleted_by,
         )
 
         try:
-            count = await self.memcell_repository.delete_by_user_id(
-                user_id=user_id, deleted_by=deleted_by
+            count = await self.memcell_repository.delete_by_event_ids(
+                event_ids=event_ids, deleted_by=deleted_by
             )
 
             logger.info(
-                "Successfully deleted MemCells by user_id: user_id=%s, deleted_by=%s, count=%d",
-                user_id,
+                "Successfully deleted MemCells by event_ids: requested=%d, deleted_by=%s, count=%d",
+                len(event_ids),
                 deleted_by,
                 count,
             )
@@ -121,80 +305,215 @@ class MemCellDeleteService:
 
         except Exception as e:
             logger.error(
-                "Failed to delete MemCells by user_id: user_id=%s, error=%s",
-                user_id,
+                "Failed to delete MemCells by event_ids: count=%d, error=%r",
+                len(event_ids),
                 e,
-                exc_info=True,
             )
             raise
 
-    async def delete_by_group_id(
-        self, group_id: str, deleted_by: Optional[str] = None
+    async def _delete_by(
+        self,
+        field: str,
+        value: str,
+        delete: Callable[..., Awaitable[int]],
+        deleted_by: Optional[str] = None,
     ) -> int:
         """
-        Batch soft delete all MemCells of a group by group_id
+        Batch soft delete all MemCells whose field equals value
+
+        Shared logging and error handling of the user and group deletes; the deletion
+        itself is the repository method of that field.
 
         Args:
-            group_id: Group ID
+            field: MemCell field to match
+            value: Value of the field
+            delete: Repository delete method of the field
             deleted_by: Identifier of the deleter (optional)
 
         Returns:
             int: Number of deleted records
-
-        Example:
-            >>> service = MemCellDeleteService(repo)
-            >>> count = await service.delete_by_group_id("group_456", "admin")
-            >>> print(f"Deleted {count} records")
         """
         logger.info(
-            "Deleting MemCells by group_id: group_id=%s, deleted_by=%s",
-            group_id,
+            "Deleting MemCells by %s: %s=%s, deleted_by=%s",
+            field,
+            field,
+            value,
             deleted_by,
         )
 
         try:
-            # Use repository's delete_many method
-            from infra_layer.adapters.out.persistence.document.memory.memcell import (
-                MemCell,
-            )
+            # The repository logs the outcome
+            return await delete(value, deleted_by=deleted_by)
 
-            result = await MemCell.delete_many(
-                {"group_id": group_id}, deleted_by=deleted_by
+        except Exception as e:
+            logger.error(
+                "Failed to delete MemCells by %s: %s=%s, error=%r",
+                field,
+                field,
+                value,
+                e,
             )
+            raise
+
+    async def _iter_delete_by(
+        self,
+        field: str,
+        value: str,
+        deleted_by: Optional[str] = None,
+        batch_size: int = 2000,
+    ) -> AsyncIterator[int]:
+        """
+        Batch soft delete all MemCells whose field equals value, yielding per batch
 
-            count = result.modified_count if result else 0
+        Shared implementation of the user and group iterators.
+
+        Args:
+            field: MemCell field to match
+            value: Value of the field
+            deleted_by: Identifier of the deleter (optional)
+            batch_size: Number of records soft deleted per batch
+
+        Yields:
+            int: Number of records deleted by each batch
+        """
+        logger.info(
+            "Deleting MemCells by %s in batches: %s=%s, deleted_by=%s, batch_size=%d",
+            field,
+            field,
+            value,
+            deleted_by,
+            batch_size,
+        )
+
+        total = 0
+        try:
+            async for count in self.memcell_repository.iter_soft_delete_in_batches(
+                {field: value}, deleted_by=deleted_by, batch_size=batch_size
+            ):
+                total += count
+                yield count
 
             logger.info(
-                "Successfully deleted MemCells by group_id: group_id=%s, deleted_by=%s, count=%d",
-                group_id,
-                deleted_by,
-                count,
+                "Successfully deleted MemCells by %s in batches: %s=%s, count=%d",
+                field,
+                field,
+                value,
+                total,
             )
 
-            return count
-
         except Exception as e:
             logger.error(
-                "Failed to delete MemCells by group_id: group_id=%s, error=%s",
-                group_id,
+                "Failed to delete MemCells by %s in batches: %s=%s, deleted=%d, error=%r",
+                field,
+                field,
+                value,
+                total,
                 e,
-                exc_info=True,
             )
             raise
 
+    async def delete_by_user_id(
+        self, user_id: str, deleted_by: Optional[str] = None
+    ) -> int:
+        """
+        Batch soft delete all MemCells of a user by user_id
+
+        Args:
+            user_id: User ID
+            deleted_by: Identifier of the deleter (optional)
+
+        Returns:
+            int: Number of deleted records
+
+        Example:
+            >>> service = MemCellDeleteService(repo)
+            >>> count = await service.delete_by_user_id("user_123", "admin")
+            >>> print(f"Deleted {count} records")
+        """
+        return await self._delete_by(
+            "user_id", user_id, self.memcell_repository.delete_by_user_id, deleted_by
+        )
+
+    def delete_by_user_id_iter(
+        self, user_id: str, deleted_by: Optional[str] = None, batch_size: int = 2000
+    ) -> AsyncIterator[int]:
+        """
+        Batch soft delete all MemCells of a user, yielding the count of each batch
+
+        Lets callers report progress on very large users or stop early: breaking out of
+        the loop stops the deletion before the next batch. Same result as
+        delete_by_user_id() when fully consumed.
+
+        Args:
+            user_id: User ID
+            deleted_by: Identifier of the deleter (optional)
+            batch_size: Number of records soft deleted per batch
+
+        Returns:
+            AsyncIterator[int]: Number of records deleted by each batch
+        """
+        return self._iter_delete_by("user_id", user_id, deleted_by, batch_size)
+
+    async def delete_by_group_id(
+        self, group_id: str, deleted_by: Optional[str] = None
+    ) -> int:
+        """
+        Batch soft delete all MemCells of a group by group_id
+
+        Args:
+            group_id: Group ID
+            deleted_by: Identifier of the deleter (optional)
+
+        Returns:
+            int: Number of deleted records
+
+        Example:
+            >>> service = MemCellDeleteService(repo)
+            >>> count = await service.delete_by_group_id("group_456", "admin")
+            >>> print(f"Deleted {count} records")
+        """
+        return await self._delete_by(
+            "group_id", group_id, self.memcell_repository.delete_by_group_id, deleted_by
+        )
+
+    def delete_by_group_id_iter(
+        self, group_id: str, deleted_by: Optional[str] = None, batch_size: int = 2000
+    ) -> AsyncIterator[int]:
+        """
+        Batch soft delete all MemCells of a group, yielding the count of each batch
+
+        Group counterpart of delete_by_user_id_iter().
+
+        Args:
+            group_id: Group ID
+            deleted_by: Identifier of the deleter (optional)
+            batch_size: Number of records soft deleted per batch
+
+        Returns:
+            AsyncIterator[int]: Number of records deleted by each batch
+        """
+        return self._iter_delete_by("group_id", group_id, deleted_by, batch_size)
+
     async def delete_by_combined_criteria(
         self,
         event_id: Optional[str] = None,
         user_id: Optional[str] = None,
         group_id: Optional[str] = None,
+        force: bool = False,
     ) -> dict:
         """
         Delete MemCell based on combined criteria (multiple conditions must all be satisfied)
 
+        When event_id is one of the criteria, a replay of a recent successful delete
+        returns the cached result without touching the database. User or group wide
+        deletes are never cached, since new MemCells may have arrived in between.
+
         Args:
             event_id: The event_id of MemCell (one of the combined conditions)
             user_id: User ID (one of the combined conditions)
             group_id: Group ID (one of the combined conditions)
+            force: Skip the result cache (restores through the repository already
+                invalidate it)
 
         Returns:
             dict: Dictionary containing deletion results
@@ -212,54 +531,64 @@ class MemCellDeleteService:
             >>> print(result)
             {'filters': ['user_id', 'group_id'], 'count': 5, 'success': True}
         """
-        from core.oxm.constants import MAGIC_ALL
-        from infra_layer.adapters.out.persistence.document.memory.memcell import MemCell
-
         # Build filter conditions
         filter_dict = {}
-        filters_used = []
-
-        if event_id and event_id != MAGIC_ALL:
-            from bson import ObjectId
-
-            try:
-                filter_dict["_id"] = ObjectId(event_id)
-                filters_used.append("event_id")
-            except Exception as e:
-                logger.error("Invalid event_id format: %s, error: %s", event_id, e)
-                return {
-                    "filters": [],
-                    "count": 0,
-                    "success": False,
-                    "error": f"Invalid event_id format: {event_id}",
-                }
-
-        if user_id and user_id != MAGIC_ALL:
+
+        if event_id not in _UNSET_CRITERIA:
+            object_id = _to_object_id(event_id)
+            if object_id is None:
+                logger.error("Invalid event_id format: %s", event_id)
+                return dict(
+                    _INVALID_EVENT_ID_RESULT,
+                    error=f"Invalid event_id format: {event_id}",
+                )
+            filter_dict["_id"] = object_id
+
+        if user_id not in _UNSET_CRITERIA:
             filter_dict["user_id"] = user_id
-            filters_used.append("user_id")
 
-        if group_id and group_id != MAGIC_ALL:
+        if group_id not in _UNSET_CRITERIA:
             filter_dict["group_id"] = group_id
-            filters_used.append("group_id")
 
-        # If no filter conditions are provided
+        # If no filter conditions are provided, the caller reports the error
         if not filter_dict:
-            logger.warning("No deletion criteria provided (all are MAGIC_ALL)")
-            return {
-                "filters": [],
-                "count": 0,
-                "success": False,
-                "error": "No deletion criteria provided",
-            }
+            return dict(_EMPTY_CRITERIA_RESULT)
+
+        filters_used = [_CRITERIA_LABELS[field] for field in filter_dict]
+
+        # A single criterion reuses its dedicated path: a keyed _id update for event_id,
+        # bounded id batches for user_id and group_id
+        if filters_used == ["event_id"]:
+            deleted = await self.delete_by_event_id(event_id, force=force)
+            return {"filters": filters_used, "count": int(deleted), "success": deleted}
+        if filters_used == ["user_id"]:
+            count = await self.delete_by_user_id(user_id)
+            return {"filters": filters_used, "count": count, "success": count > 0}
+        if filters_used == ["group_id"]:
+            count = await self.delete_by_group_id(group_id)
+            return {"filters": filters_used, "count": count, "success": count > 0}
+
+        cache_key = None
+        if "_id" in filter_dict:
+            cache_key = ("combo", tuple(sorted(filter_dict.items())))
+            cached = (
+                None
+                if force
+                else self.memcell_repository.get_cached_delete_result(cache_key)
+            )
+            if cached is not None:
+                logger.debug(
+                    "MemCell delete served from cache: filters=%s", filters_used
+                )
+                return dict(cached)
 
         logger.info(
             "Deleting MemCells with combined criteria: filters=%s", filters_used
         )
 
         try:
-            # Use delete_many to batch soft delete
-            result = await MemCell.delete_many(filter_dict)
-            count = result.modified_count if result else 0
+            # Single update_many, no read-back: modified_count is the deleted count
+            count = (await MemCell.delete_many(filter_dict)).modified_count
 
             logger.info(
                 "Successfully deleted MemCells: filters=%s, count=%d",
@@ -267,13 +596,15 @@ class MemCellDeleteService:
                 count,
             )
 
-            return {"filters": filters_used, "count": count, "success": count > 0}
+            result = {"filters": filters_used, "count": count, "success": count > 0}
+            if cache_key is not None and count > 0:
+                self.memcell_repository.cache_delete_result(cache_key, result)
+            return dict(result)
 
         except Exception as e:
             logger.error(
-                "Failed to delete MemCells with combined criteria: filters=%s, error=%s",
+                "Failed to delete MemCells with combined criteria: filters=%s, error=%r",
                 filters_used,
                 e,
-                exc_info=True,
             )
             raise
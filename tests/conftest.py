@@ -0,0 +1,124 @@
+"""Shared fixtures: an in-memory stand-in for the pymongo collection of MemCell."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from bson.codec_options import CodecOptions
+
+
+def _matches(doc, filter_query):
+    """Evaluate the subset of MongoDB filters used by the soft delete paths."""
+    for field, condition in filter_query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            for operator, operand in condition.items():
+                if operator == "$in":
+                    matched = value in operand
+                elif operator == "$ne":
+                    matched = value != operand
+                elif operator == "$exists":
+                    matched = (field in doc) == operand
+                else:
+                    raise NotImplementedError(operator)
+                if not matched:
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeCollection:
+    """
+    In-memory collection recording the writes it receives
+
+    Set fail_with to make every write raise that exception.
+    """
+
+    codec_options = CodecOptions()
+
+    def __init__(self):
+        self.docs = {}
+        self.update_many_calls = []
+        self.bulk_write_calls = []
+        self.fail_with = None
+
+    def insert(self, **fields):
+        """Store a raw document and return its _id"""
+        doc = {"_id": ObjectId(), **fields}
+        self.docs[doc["_id"]] = doc
+        return doc["_id"]
+
+    def insert_live(self, **fields):
+        """Store an undeleted document carrying the soft delete fields, return its _id"""
+        return self.insert(deleted=False, deleted_at=None, deleted_by=None, **fields)
+
+    def with_options(self, codec_options=None):
+        return self
+
+    def _apply(self, filter_query, update, first_only=False):
+        modified = 0
+        for doc in self.docs.values():
+            if _matches(doc, filter_query):
+                doc.update(update["$set"])
+                modified += 1
+                if first_only:
+                    break
+        return modified
+
+    async def _write(self):
+        # Yield to the loop like a real round trip, so concurrent writes interleave
+        await asyncio.sleep(0)
+        if self.fail_with is not None:
+            raise self.fail_with
+
+    async def update_one(self, filter_query, update, session=None, **kwargs):
+        await self._write()
+        return SimpleNamespace(
+            modified_count=self._apply(filter_query, update, first_only=True)
+        )
+
+    async def update_many(self, filter_query, update, session=None, **kwargs):
+        self.update_many_calls.append(filter_query)
+        await self._write()
+        return SimpleNamespace(modified_count=self._apply(filter_query, update))
+
+    async def bulk_write(self, operations, ordered=True, session=None, **kwargs):
+        self.bulk_write_calls.append(operations)
+        await self._write()
+        modified = sum(
+            self._apply(op._filter, op._doc, first_only=True) for op in operations
+        )
+        return SimpleNamespace(modified_count=modified)
+
+    async def delete_many(self, filter_query, session=None, **kwargs):
+        await self._write()
+        ids = [
+            doc_id for doc_id, doc in self.docs.items() if _matches(doc, filter_query)
+        ]
+        for doc_id in ids:
+            del self.docs[doc_id]
+        return SimpleNamespace(deleted_count=len(ids))
+
+    def find(self, filter_query, projection=None, session=None, **kwargs):
+        return self._find(filter_query)
+
+    async def _find(self, filter_query):
+        for doc in list(self.docs.values()):
+            if _matches(doc, filter_query):
+                yield {"_id": doc["_id"]}
+
+
+@pytest.fixture
+def memcell_collection(monkeypatch):
+    """Bind MemCell to a fresh FakeCollection for the duration of a test."""
+    from infra_layer.adapters.out.persistence.document.memory.memcell import MemCell
+
+    collection = FakeCollection()
+    monkeypatch.setattr(
+        MemCell, "get_pymongo_collection", classmethod(lambda cls: collection)
+    )
+    MemCell.reset_collection_cache()
+    yield collection
+    MemCell.reset_collection_cache()
@@ -17,9 +17,12 @@ class DummyService:
 
 
 @pytest.mark.asyncio
-async def test_shutdown_closes_vectorize_and_rerank_services(monkeypatch):
+async def test_shutdown_closes_vectorize_rerank_and_memcell_delete_services(
+    monkeypatch,
+):
     vectorize = DummyService()
     rerank = DummyService()
+    memcell_delete = DummyService()
 
     monkeypatch.setattr(
         business_lifespan, "get_vectorize_service", lambda: vectorize, raising=False
@@ -27,6 +30,12 @@ async def test_shutdown_closes_vectorize_and_rerank_services(monkeypatch):
     monkeypatch.setattr(
         business_lifespan, "get_rerank_service", lambda: rerank, raising=False
     )
+    monkeypatch.setattr(
+        business_lifespan,
+        "get_memcell_delete_service",
+        lambda: memcell_delete,
+        raising=False,
+    )
 
     provider = BusinessLifespanProvider()
     app = SimpleNamespace(state=SimpleNamespace(graphs={"k": "v"}))
@@ -35,4 +44,5 @@ async def test_shutdown_closes_vectorize_and_rerank_services(monkeypatch):
 
     assert vectorize.closed is True
     assert rerank.closed is True
+    assert memcell_delete.closed is True
     assert not hasattr(app.state, "graphs")
@@ -0,0 +1,329 @@
+"""Tests for DocumentBaseWithSoftDelete, run on MemCell against an in-memory collection."""
+
+from datetime import timedelta
+
+import pytest
+from beanie.odm.bulk import BulkWriter
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from common_utils.datetime_utils import get_now_with_timezone
+from core.oxm.mongo.document_base_with_soft_delete import (
+    _current_delete_timestamp,
+    _get_delete_timestamp,
+)
+from infra_layer.adapters.out.persistence.document.memory.memcell import MemCell
+
+
+def _memcell(doc_id, **fields):
+    return MemCell(id=doc_id, user_id="u1", timestamp=get_now_with_timezone(), **fields)
+
+
+@pytest.mark.asyncio
+async def test_restore_round_trip(memcell_collection):
+    doc_id = memcell_collection.insert_live()
+    memcell = _memcell(doc_id)
+
+    await memcell.delete(deleted_by="admin")
+    assert memcell.is_deleted()
+    assert memcell_collection.docs[doc_id]["deleted_by"] == "admin"
+
+    await memcell.restore()
+    assert not memcell.is_deleted()
+    assert memcell.deleted_at is None
+    assert memcell_collection.docs[doc_id]["deleted"] is False
+
+    # The instance must not be stuck as deleted: deleting it again writes again
+    await memcell.delete(deleted_by="admin_2")
+    assert memcell.is_deleted()
+    assert memcell_collection.docs[doc_id]["deleted_by"] == "admin_2"
+
+
+def test_document_without_deleted_flag_loads_as_deleted(memcell_collection):
+    legacy = MemCell.model_validate(
+        {
+            "user_id": "u1",
+            "timestamp": get_now_with_timezone(),
+            "deleted_at": get_now_with_timezone(),
+        }
+    )
+    assert legacy.is_deleted()
+
+
+@pytest.mark.asyncio
+async def test_delete_and_restore_through_a_bulk_writer(
+    memcell_collection, monkeypatch
+):
+    monkeypatch.setattr(
+        MemCell, "get_collection_name", classmethod(lambda cls: "memcells")
+    )
+    live = _memcell(memcell_collection.insert_live())
+    stale_id = memcell_collection.insert(
+        deleted=True, deleted_at=get_now_with_timezone(), deleted_by="first"
+    )
+    # Loaded before another caller deleted the document
+    stale = _memcell(stale_id)
+
+    bulk_writer = BulkWriter()
+    await live.delete(bulk_writer=bulk_writer, deleted_by="admin")
+    await stale.delete(bulk_writer=bulk_writer, deleted_by="admin")
+    assert memcell_collection.bulk_write_calls == []
+    await bulk_writer.commit()
+
+    assert memcell_collection.docs[live.id]["deleted_by"] == "admin"
+    assert memcell_collection.docs[stale_id]["deleted_by"] == "first"
+
+    memcell_collection.docs[live.id].update(deleted=False, deleted_at=None)
+    bulk_writer = BulkWriter()
+    await live.restore(bulk_writer=bulk_writer)
+    await bulk_writer.commit()
+
+    # Restored elsewhere in the meantime: the queued restore matched nothing
+    assert memcell_collection.docs[live.id]["deleted_by"] == "admin"
+    assert not live.is_deleted()
+
+
+def test_batch_delete_window_shares_one_timestamp():
+    with MemCell.batch_delete_window() as window_timestamp:
+        assert _get_delete_timestamp() == window_timestamp
+        with MemCell.batch_delete_window() as inner_timestamp:
+            assert _get_delete_timestamp() == inner_timestamp
+        assert _get_delete_timestamp() == window_timestamp
+
+    assert _current_delete_timestamp.get() is None
+
+
+@pytest.mark.asyncio
+async def test_deletes_in_a_batch_delete_window_share_its_timestamp(memcell_collection):
+    memcell = _memcell(memcell_collection.insert_live(user_id="u1"))
+    memcell_collection.insert_live(user_id="u2")
+
+    with MemCell.batch_delete_window() as window_timestamp:
+        await memcell.delete()
+        await MemCell.delete_many({"user_id": "u2"})
+
+    assert [doc["deleted_at"] for doc in memcell_collection.docs.values()] == [
+        window_timestamp
+    ] * 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_and_bulk_restore(memcell_collection):
+    live_ids = [memcell_collection.insert_live() for _ in range(2)]
+    memcells = [_memcell(doc_id) for doc_id in live_ids]
+    already_deleted = _memcell(ObjectId(), deleted=True)
+
+    result = await MemCell.bulk_delete(memcells + [already_deleted], deleted_by="job")
+
+    assert result.modified_count == 2
+    assert len(memcell_collection.bulk_write_calls) == 1
+    assert len(memcell_collection.bulk_write_calls[0]) == 2
+    assert all(memcell.is_deleted() for memcell in memcells)
+    assert memcells[0].deleted_at == memcells[1].deleted_at
+
+    result = await MemCell.bulk_restore(memcells)
+
+    assert result.modified_count == 2
+    assert not any(memcell.is_deleted() for memcell in memcells)
+    assert all(
+        memcell_collection.docs[doc_id]["deleted"] is False for doc_id in live_ids
+    )
+    assert await MemCell.bulk_restore(memcells) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_ids_reports_only_ids_it_deleted(memcell_collection):
+    live = memcell_collection.insert_live()
+    deleted = memcell_collection.insert(
+        deleted=True, deleted_at=get_now_with_timezone() - timedelta(days=1)
+    )
+    missing = ObjectId()
+
+    deleted_ids = await MemCell.bulk_delete_by_ids(
+        [(live, "first"), (deleted, "first"), (missing, "first"), (live, "second")]
+    )
+
+    assert deleted_ids == {live}
+    assert memcell_collection.docs[live]["deleted_by"] == "first"
+    assert len(memcell_collection.bulk_write_calls[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_ids_calls_in_one_window_do_not_collide(
+    memcell_collection,
+):
+    first = memcell_collection.insert_live()
+    second = memcell_collection.insert_live()
+
+    with MemCell.batch_delete_window():
+        assert await MemCell.bulk_delete_by_ids([(first, None)]) == {first}
+        deleted_ids = await MemCell.bulk_delete_by_ids([(first, None), (second, None)])
+
+    assert deleted_ids == {second}
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_ids_ignores_deletes_with_the_same_timestamp(
+    memcell_collection,
+):
+    now = get_now_with_timezone().replace(microsecond=0)
+    live = memcell_collection.insert_live()
+    # Deleted by another process with the very same timestamp
+    other = memcell_collection.insert(
+        deleted=True, deleted_at=now, delete_marker=ObjectId()
+    )
+
+    deleted_ids = await MemCell.bulk_delete_by_ids(
+        [(live, None), (other, None)], now=now
+    )
+
+    assert deleted_ids == {live}
+    assert memcell_collection.docs[live]["delete_marker"] is not None
+    assert "delete_marker" not in _memcell(live).model_dump()
+
+
+@pytest.mark.asyncio
+async def test_delete_many_batched_sequential(memcell_collection):
+    for _ in range(5):
+        memcell_collection.insert_live(user_id="u1")
+    memcell_collection.insert_live(user_id="u2")
+
+    count = await MemCell.delete_many_batched({"user_id": "u1"}, batch_size=2)
+
+    assert count == 5
+    assert len(memcell_collection.update_many_calls) == 3
+    assert [doc["deleted"] for doc in memcell_collection.docs.values()] == [
+        True
+    ] * 5 + [False]
+
+
+@pytest.mark.asyncio
+async def test_delete_many_batched_concurrent(memcell_collection):
+    for _ in range(7):
+        memcell_collection.insert_live(user_id="u1")
+
+    count = await MemCell.delete_many_batched(
+        {"user_id": "u1"}, batch_size=2, concurrency=3
+    )
+
+    assert count == 7
+    assert len(memcell_collection.update_many_calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_delete_many_batched_concurrent_failure_raises_driver_error(
+    memcell_collection,
+):
+    for _ in range(4):
+        memcell_collection.insert_live(user_id="u1")
+    memcell_collection.fail_with = OperationFailure("boom")
+
+    with pytest.raises(OperationFailure):
+        await MemCell.delete_many_batched(
+            {"user_id": "u1"}, batch_size=1, concurrency=2
+        )
+
+
+@pytest.mark.asyncio
+async def test_iter_delete_many_batched_stops_with_the_caller(memcell_collection):
+    for _ in range(5):
+        memcell_collection.insert_live(user_id="u1")
+
+    counts = []
+    async for count in MemCell.iter_delete_many_batched(
+        {"user_id": "u1"}, batch_size=2
+    ):
+        counts.append(count)
+        break
+
+    assert counts == [2]
+    assert sum(doc["deleted"] for doc in memcell_collection.docs.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_many_batched(memcell_collection):
+    for _ in range(5):
+        memcell_collection.insert_live(user_id="u1")
+    keep = memcell_collection.insert_live(user_id="u2")
+
+    count = await MemCell.hard_delete_many_batched({"user_id": "u1"}, batch_size=2)
+
+    assert count == 5
+    assert list(memcell_collection.docs) == [keep]
+
+
+@pytest.mark.asyncio
+async def test_migrate_soft_delete_flag(memcell_collection):
+    live = memcell_collection.insert(deleted_at=None)
+    deleted = memcell_collection.insert(deleted_at=get_now_with_timezone())
+    migrated = memcell_collection.insert_live()
+
+    assert await MemCell.migrate_soft_delete_flag() == 2
+
+    assert memcell_collection.docs[live]["deleted"] is False
+    assert memcell_collection.docs[deleted]["deleted"] is True
+    assert memcell_collection.docs[migrated]["deleted"] is False
+    assert await MemCell.migrate_soft_delete_flag() == 0
+
+
+def test_find_one_simple_adds_soft_delete_predicate(monkeypatch, memcell_collection):
+    calls = []
+
+    class RecordingFindOne:
+        def __init__(self, document_model):
+            pass
+
+        def find_one(self, *args, **kwargs):
+            calls.append((args, kwargs))
+            return "query"
+
+    monkeypatch.setattr(MemCell, "_find_one_query_class", RecordingFindOne)
+    # MemCell uses no beanie inheritance, so it has no class id filter
+    monkeypatch.setattr(
+        MemCell,
+        "_add_class_id_filter",
+        classmethod(lambda cls, args, with_children=False: args),
+    )
+    doc_id = ObjectId()
+
+    assert MemCell.find_one_simple({"_id": doc_id}) == "query"
+    assert calls == [(({"_id": doc_id}, {"deleted": False}), {"ignore_cache": True})]
+
+
+def test_soft_delete_filter_is_read_only():
+    with pytest.raises(TypeError):
+        MemCell.get_soft_delete_filter()["deleted"] = True
+    with pytest.raises(TypeError):
+        MemCell.get_soft_delete_filter(include_deleted=True)["deleted"] = True
+
+    assert MemCell.get_soft_delete_filter() == {"deleted": False}
+    assert MemCell.get_soft_delete_filter_copy() == {"deleted": False}
+
+
+def test_apply_soft_delete_filter_without_query_returns_a_new_dict():
+    applied = MemCell.apply_soft_delete_filter()
+    applied["user_id"] = "u1"
+
+    assert MemCell.apply_soft_delete_filter() == {"deleted": False}
+    assert MemCell.get_soft_delete_filter() == {"deleted": False}
+
+
+@pytest.mark.asyncio
+async def test_every_restore_path_notifies_restore_listeners(memcell_collection):
+    class Listener:
+        calls = 0
+
+        def restored(self):
+            self.calls += 1
+
+    listener = Listener()
+    MemCell.add_restore_listener(listener.restored)
+    memcell = _memcell(memcell_collection.insert_live(user_id="u1"))
+
+    await memcell.delete()
+    await memcell.restore()
+    await memcell.delete()
+    await MemCell.bulk_restore([memcell])
+    await MemCell.restore_many({"user_id": "u1"})
+
+    assert listener.calls == 3
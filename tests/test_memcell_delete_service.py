@@ -0,0 +1,266 @@
+"""Tests for MemCellDeleteService, run against an in-memory MemCell collection."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from pymongo.errors import OperationFailure
+
+from infra_layer.adapters.out.persistence.document.memory.memcell import MemCell
+from infra_layer.adapters.out.persistence.repository.memcell_raw_repository import (
+    MemCellRawRepository,
+)
+from service.memcell_delete_service import MemCellDeleteService
+
+
+@pytest.fixture
+def repository(memcell_collection, monkeypatch):
+    monkeypatch.setenv("MEMCELL_DELETE_CACHE_ENABLED", "true")
+    return MemCellRawRepository()
+
+
+@pytest_asyncio.fixture
+async def service(repository):
+    service = MemCellDeleteService(repository)
+    yield service
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_event_deletes_share_one_bulk_write(
+    service, memcell_collection
+):
+    ids = [memcell_collection.insert_live() for _ in range(3)]
+
+    results = await asyncio.gather(
+        *(service.delete_by_event_id(str(doc_id), "admin") for doc_id in ids)
+    )
+
+    assert results == [True, True, True]
+    assert len(memcell_collection.bulk_write_calls) == 1
+    assert len(memcell_collection.bulk_write_calls[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_repeated_event_id_succeeds_once(service, memcell_collection):
+    event_id = str(memcell_collection.insert_live())
+
+    results = await asyncio.gather(
+        service.delete_by_event_id(event_id), service.delete_by_event_id(event_id)
+    )
+
+    assert sorted(results) == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_error_reaches_every_waiter(service, memcell_collection):
+    ids = [str(memcell_collection.insert_live()) for _ in range(2)]
+    memcell_collection.fail_with = OperationFailure("boom")
+
+    results = await asyncio.gather(
+        *(service.delete_by_event_id(event_id) for event_id in ids),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, OperationFailure) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_close_fails_deletes_in_flight(service, memcell_collection, monkeypatch):
+    event_id = str(memcell_collection.insert_live())
+    release = asyncio.Event()
+
+    async def blocked_bulk_write(*args, **kwargs):
+        await release.wait()
+
+    monkeypatch.setattr(memcell_collection, "bulk_write", blocked_bulk_write)
+    pending = asyncio.create_task(service.delete_by_event_id(event_id))
+    await asyncio.sleep(0.05)
+
+    await service.close()
+
+    with pytest.raises(RuntimeError):
+        await pending
+
+
+@pytest.mark.asyncio
+async def test_worker_ignores_the_first_callers_delete_window(
+    service, memcell_collection
+):
+    first = memcell_collection.insert_live()
+    second = memcell_collection.insert_live()
+
+    with MemCell.batch_delete_window() as window_timestamp:
+        assert await service.delete_by_event_id(str(first))
+    await asyncio.sleep(0.01)
+    assert await service.delete_by_event_id(str(second))
+
+    assert memcell_collection.docs[second]["deleted_at"] != window_timestamp
+    assert (
+        memcell_collection.docs[second]["deleted_at"]
+        > memcell_collection.docs[first]["deleted_at"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_replayed_delete_is_served_from_cache(service, memcell_collection):
+    event_id = str(memcell_collection.insert_live())
+
+    assert await service.delete_by_event_id(event_id, "admin")
+    assert await service.delete_by_event_id(event_id, "admin")
+
+    assert len(memcell_collection.bulk_write_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_force_skips_the_cache(service, memcell_collection):
+    event_id = str(memcell_collection.insert_live())
+
+    assert await service.delete_by_event_id(event_id)
+    assert not await service.delete_by_event_id(event_id, force=True)
+
+    assert len(memcell_collection.bulk_write_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_entry_reaches_the_database(
+    memcell_collection, monkeypatch
+):
+    monkeypatch.setenv("MEMCELL_DELETE_CACHE_ENABLED", "true")
+    monkeypatch.setattr(MemCellRawRepository, "DELETE_RESULT_CACHE_TTL_SECONDS", 0.0)
+    service = MemCellDeleteService(MemCellRawRepository())
+    event_id = str(memcell_collection.insert_live())
+
+    try:
+        assert await service.delete_by_event_id(event_id)
+        assert not await service.delete_by_event_id(event_id)
+    finally:
+        await service.close()
+
+    assert len(memcell_collection.bulk_write_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_restore_invalidates_the_cache(service, repository, memcell_collection):
+    doc_id = memcell_collection.insert_live(user_id="u1")
+
+    assert await service.delete_by_event_id(str(doc_id))
+    assert await repository.restore_by_user_id("u1") == 1
+    assert await service.delete_by_event_id(str(doc_id))
+
+    assert memcell_collection.docs[doc_id]["deleted"] is True
+    assert len(memcell_collection.bulk_write_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_restore_outside_the_repository_invalidates_the_cache(
+    service, memcell_collection
+):
+    doc_id = memcell_collection.insert_live(user_id="u1")
+
+    assert await service.delete_by_event_id(str(doc_id))
+    result = await MemCell.restore_many({"user_id": "u1"})
+    assert result.modified_count == 1
+    assert await service.delete_by_event_id(str(doc_id))
+
+    assert memcell_collection.docs[doc_id]["deleted"] is True
+    assert len(memcell_collection.bulk_write_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_is_disabled_by_default(memcell_collection, monkeypatch):
+    monkeypatch.delenv("MEMCELL_DELETE_CACHE_ENABLED", raising=False)
+    service = MemCellDeleteService(MemCellRawRepository())
+    event_id = str(memcell_collection.insert_live())
+
+    try:
+        assert await service.delete_by_event_id(event_id)
+        assert not await service.delete_by_event_id(event_id)
+    finally:
+        await service.close()
+
+    assert len(memcell_collection.bulk_write_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_combined_criteria_with_only_event_id_uses_the_coalescer(
+    service, memcell_collection
+):
+    event_id = str(memcell_collection.insert_live())
+
+    result = await service.delete_by_combined_criteria(event_id=event_id)
+
+    assert result == {"filters": ["event_id"], "count": 1, "success": True}
+    assert len(memcell_collection.bulk_write_calls) == 1
+    assert memcell_collection.update_many_calls == []
+
+
+@pytest.mark.asyncio
+async def test_combined_criteria_with_only_user_id_deletes_in_batches(
+    service, memcell_collection
+):
+    for _ in range(3):
+        memcell_collection.insert_live(user_id="u1")
+    memcell_collection.insert_live(user_id="u2")
+
+    result = await service.delete_by_combined_criteria(user_id="u1")
+
+    assert result == {"filters": ["user_id"], "count": 3, "success": True}
+    assert memcell_collection.bulk_write_calls == []
+
+
+@pytest.mark.asyncio
+async def test_combined_criteria_without_criteria(service):
+    result = await service.delete_by_combined_criteria()
+
+    assert result["success"] is False
+    assert result["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_by_event_ids_skips_invalid_ids(service, memcell_collection):
+    ids = [str(memcell_collection.insert_live()) for _ in range(2)]
+
+    count = await service.delete_by_event_ids(ids + ["not-an-object-id"], "admin")
+
+    assert count == 2
+    assert len(memcell_collection.update_many_calls) == 1
+    assert all(doc["deleted_by"] == "admin" for doc in memcell_collection.docs.values())
+
+
+@pytest.mark.asyncio
+async def test_delete_by_event_ids_writes_bounded_batches(
+    repository, memcell_collection
+):
+    ids = [str(memcell_collection.insert_live()) for _ in range(5)]
+
+    count = await repository.delete_by_event_ids(ids, batch_size=2)
+
+    assert count == 5
+    assert [
+        len(call["_id"]["$in"]) for call in memcell_collection.update_many_calls
+    ] == [2, 2, 1]
+    assert len({doc["deleted_at"] for doc in memcell_collection.docs.values()}) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_by_event_ids_propagates_database_errors(
+    service, memcell_collection
+):
+    event_id = str(memcell_collection.insert_live())
+    memcell_collection.fail_with = OperationFailure("boom")
+
+    with pytest.raises(OperationFailure):
+        await service.delete_by_event_ids([event_id])
+
+
+@pytest.mark.asyncio
+async def test_delete_by_user_id_iter_propagates_database_errors(
+    service, memcell_collection
+):
+    memcell_collection.insert_live(user_id="u1")
+    memcell_collection.fail_with = OperationFailure("boom")
+
+    with pytest.raises(OperationFailure):
+        async for _ in service.delete_by_user_id_iter("u1"):
+            pass
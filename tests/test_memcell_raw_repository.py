@@ -834,11 +834,11 @@ async def test_soft_delete_single():
         assert hard_found.is_deleted(), "Record should be marked as deleted"
         assert hard_found.deleted_by == "test_admin", "Should record who deleted it"
         assert hard_found.deleted_at is not None, "Should have deletion timestamp"
-        assert hard_found.deleted_id != 0, "deleted_id should be set"
+        assert hard_found.deleted is True, "deleted flag should be set"
         logger.info("✅ Verified: hard_find_one can find deleted record")
         logger.info("   - deleted_by: %s", hard_found.deleted_by)
         logger.info("   - deleted_at: %s", hard_found.deleted_at)
-        logger.info("   - deleted_id: %s", hard_found.deleted_id)
+        logger.info("   - deleted: %s", hard_found.deleted)
         
         # 恢复记录
         restored = await repo.restore_by_event_id(event_id)
@@ -851,7 +851,7 @@ async def test_soft_delete_single():
         assert not restored_memcell.is_deleted(), "Should not be marked as deleted after restore"
         assert restored_memcell.deleted_at is None, "deleted_at should be cleared"
         assert restored_memcell.deleted_by is None, "deleted_by should be cleared"
-        assert restored_memcell.deleted_id == 0, "deleted_id should be reset to 0"
+        assert restored_memcell.deleted is False, "deleted flag should be cleared"
         logger.info("✅ Verified: Record is normal after restore")
         
         # 清理
@@ -1093,7 +1093,7 @@ async def test_prevent_duplicate_soft_delete():
                 "event_id": event_ids[i],
                 "deleted_at": mc.deleted_at,
                 "deleted_by": mc.deleted_by,
-                "deleted_id": mc.deleted_id,
+                "deleted": mc.deleted,
             })
         logger.info("✅ Captured audit info from first delete")
         
@@ -1117,8 +1117,8 @@ async def test_prevent_duplicate_soft_delete():
                 f"deleted_at should not change for record {i}"
             assert mc.deleted_by == original["deleted_by"], \
                 f"deleted_by should not change for record {i}, expected {original['deleted_by']}, got {mc.deleted_by}"
-            assert mc.deleted_id == original["deleted_id"], \
-                f"deleted_id should not change for record {i}"
+            assert mc.deleted == original["deleted"], \
+                f"deleted flag should not change for record {i}"
         logger.info("✅ Verified: First 3 records' audit info was NOT modified")
         
         # 验证后2条记录被新的删除操作标记
@@ -1135,7 +1135,7 @@ async def test_prevent_duplicate_soft_delete():
         test_record = await MemCell.hard_find_one({"_id": ObjectId(event_ids[0])})
         original_deleted_at = test_record.deleted_at
         original_deleted_by = test_record.deleted_by
-        original_deleted_id = test_record.deleted_id
+        original_deleted = test_record.deleted
         
         # 再次尝试删除（应该被忽略）
         await test_record.delete(deleted_by="admin_3")
@@ -1146,8 +1146,8 @@ async def test_prevent_duplicate_soft_delete():
             "deleted_at should not change on duplicate delete"
         assert test_record_after.deleted_by == original_deleted_by, \
             "deleted_by should not change on duplicate delete"
-        assert test_record_after.deleted_id == original_deleted_id, \
-            "deleted_id should not change on duplicate delete"
+        assert test_record_after.deleted == original_deleted, \
+            "deleted flag should not change on duplicate delete"
         logger.info("✅ Verified: Instance method delete() also prevents duplicate deletion")
         
         # 清理
@@ -1202,7 +1202,7 @@ async def run_all_tests():
         logger.info("4. ✅ 查询自动过滤已删除记录")
         logger.info("5. ✅ hard_find 可以查询已删除记录")
         logger.info("6. ✅ 硬删除（物理删除）正常工作")
-        logger.info("7. ✅ deleted_by、deleted_at、deleted_id 字段正确设置")
+        logger.info("7. ✅ deleted_by、deleted_at、deleted 字段正确设置")
         logger.info("8. ✅ 防止重复软删除，保护审计记录")
     except Exception as e:
         logger.error("❌ Error occurred during testing: %s", e)